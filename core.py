@@ -9,59 +9,95 @@ Optimized Orange Pixipal - Performance Enhanced Version
 Major optimizations applied for reduced lag and better responsiveness
 """
 
+import os
 import sys
 import time
+import logging
 import itertools
+import math
+import importlib.util
 import pathlib
-import traceback
-from PyQt5.QtCore import Qt, QTimer, QSize, QElapsedTimer, QThread, pyqtSignal
-from PyQt5.QtGui import QMovie, QKeySequence, QPixmap
-from PyQt5.QtWidgets import QApplication, QLabel, QShortcut
+import queue
+from array import array
+from PyQt5.QtCore import Qt, QTimer, QSize, QElapsedTimer, QMetaObject, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QCursor, QImage, QImageReader, QKeySequence, QPainter, QPixmap
+from PyQt5.QtWidgets import QApplication, QShortcut, QWidget
+
+logging.basicConfig(format="%(message)s")
+log = logging.getLogger("pixipal")
+log.setLevel(logging.INFO)  # Set to DEBUG for per-event messages
 
 # Safe Imports with Fallbacks
 try:
-    import psutil
     import win32gui
     import win32process
 
-    HAS_PSUTIL = True
     HAS_WIN32 = True
-except ImportError as e:
-    if 'win32' in str(e):
-        HAS_WIN32 = False
-        print("Warning: win32gui not available, using basic browser detection")
-        try:
-            import psutil
+except ImportError:
+    HAS_WIN32 = False
+    log.warning("Warning: win32gui not available, browser detection disabled")
 
-            HAS_PSUTIL = True
-        except ImportError:
-            HAS_PSUTIL = False
-            print("Warning: psutil not available, browser detection disabled")
-    else:
-        HAS_PSUTIL = False
-        HAS_WIN32 = False
-        print("Warning: psutil not available, browser detection disabled")
+# psutil only backs up the native exe-name lookup, so it is found here but imported on first use
+psutil = None
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
 
-try:
-    import pyautogui
 
-    pyautogui.FAILSAFE = False
-    HAS_PYAUTOGUI = True
-except ImportError:
-    HAS_PYAUTOGUI = False
-    print("Error: pyautogui is required")
-    sys.exit(1)
+def import_psutil():
+    """Import psutil the first time the native lookup can't answer"""
+    global psutil
+    if psutil is None:
+        import psutil as module
+        psutil = module
+    return psutil
+
+
+try:
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.windll.user32
+    kernel32 = ctypes.windll.kernel32
+
+    LowLevelMouseProc = ctypes.WINFUNCTYPE(wintypes.LPARAM, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+    user32.SetWindowsHookExW.argtypes = (ctypes.c_int, LowLevelMouseProc, wintypes.HINSTANCE, wintypes.DWORD)
+    user32.SetWindowsHookExW.restype = wintypes.HHOOK
+    user32.CallNextHookEx.argtypes = (wintypes.HHOOK, ctypes.c_int, wintypes.WPARAM, wintypes.LPARAM)
+    user32.CallNextHookEx.restype = wintypes.LPARAM
+    user32.UnhookWindowsHookEx.argtypes = (wintypes.HHOOK,)
+    kernel32.GetModuleHandleW.restype = wintypes.HMODULE
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = (wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                    ctypes.POINTER(wintypes.DWORD))
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+
+    class MSLLHOOKSTRUCT(ctypes.Structure):
+        _fields_ = [("pt", wintypes.POINT), ("mouseData", wintypes.DWORD), ("flags", wintypes.DWORD),
+                    ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+    LP_MSLLHOOKSTRUCT = ctypes.POINTER(MSLLHOOKSTRUCT)
+    WinEventProc = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND, wintypes.LONG,
+                                      wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    user32.SetWinEventHook.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+                                       wintypes.DWORD, wintypes.DWORD, wintypes.DWORD)
+    user32.SetWinEventHook.restype = wintypes.HANDLE
+    user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+
+    HAS_WINDLL = True
+except (ImportError, AttributeError, OSError, ValueError):
+    HAS_WINDLL = False
+    log.warning("Warning: ctypes.windll not available, click detection disabled")
 
 try:
-    import win32api
-    import win32con
+    from numba import njit
 
-    HAS_WIN32API = True
+    HAS_NUMBA = True
 except ImportError:
-    HAS_WIN32API = False
-    print("Warning: win32api not available, click detection disabled")
+    HAS_NUMBA = False  # Optional: follow_step simply stays interpreted
 
 ASSET_DIR = pathlib.Path(__file__).parent
+FRAME_CACHE_DIR = ASSET_DIR / ".frame_cache"  # Pre-scaled frames; decoding the full-size GIFs takes ~25 s
+FRAME_SHEET_MAX_PX = 32767  # QPainter's raster engine drops drawImage calls past this coordinate
 
 # Animation Constants (unchanged)
 IDLE_CLIP_1 = "idle_animation_1.gif"
@@ -83,12 +119,17 @@ ENJOY = "enjoying_with_us.gif"
 WATCHING = "watching.gif"
 
 IDLE_CLIPS = [IDLE_CLIP_1, IDLE_CLIP_2, IDLE_CLIP_3, IDLE_CLIP_4, IDLE_CLIP_5]
+ALL_CLIPS = (*IDLE_CLIPS, WALK_LEFT, WALK_RIGHT, RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R,
+             RUN2SLOW_L, RUN2SLOW_R, CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING)
 
 # Optimized Constants
 WALK_VEL = 50
 FAST_CURSOR_SPEED = 400
+FAST_CURSOR_SPEED_LO = 300  # Hysteresis: once fast, the cursor stays fast until the EMA drops below this
 RUN_IDLE_MAX_TIME = 5
+RUN_TO_IDLE_MS = 800  # Running clip time before settling into the running idle
 STICKMAN_FOLLOW_SPEED = 3.0
+FOLLOW_SPEED_MILLI = int(STICKMAN_FOLLOW_SPEED * 1000)  # Integer form used by follow_step
 
 # Timing constants
 IDLE_ANIMATION_TIMEOUT_1 = int(40.9 * 1000)
@@ -97,10 +138,30 @@ IDLE_ANIMATION_TIMEOUT_3 = int(31.5 * 1000)
 IDLE_ANIMATION_TIMEOUT_4 = int(8.833333 * 1000)
 IDLE_ANIMATION_TIMEOUT_5 = 0
 
+# Fallback one-shot lengths; the decoded clip's own frame delays are used once it has loaded
 ENJOY_DURATION = int(0.766666 * 1000)
 CLICK_SINGLE_DURATION = int(0.7666666 * 1000)
 CLICK_DOUBLE_DURATION = int(1.1333333 * 1000)
 
+# update_state tick: fast while the cursor moves, slow while it rests
+TICK_ACTIVE_MS = 16
+TICK_IDLE_MS = 400
+# Window steps below this are held back while the stickman closes in; at 16 ms ticks the last ~40 px are 1 px steps
+MIN_MOVE_PX = 2
+
+# Win32 hook constants
+WH_MOUSE_LL = 14
+HC_ACTION = 0
+WM_QUIT = 0x0012
+WM_MOUSEMOVE = 0x0200
+WM_LBUTTONDOWN = 0x0201
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+
+PID_NAME_TTL = 60.0  # Seconds before a cached (pid, thread id) -> exe name entry is re-queried
+HWND_RESULT_TTL = 30.0  # Seconds a foreground-window answer is reused before re-checking (hwnds get reused)
+
 IDLE_TIMEOUTS = [
     IDLE_ANIMATION_TIMEOUT_1,
     IDLE_ANIMATION_TIMEOUT_2,
@@ -109,44 +170,105 @@ IDLE_TIMEOUTS = [
     IDLE_ANIMATION_TIMEOUT_5
 ]
 
-CHROME_NAMES = {"chrome.exe", "msedge.exe", "firefox.exe", "brave.exe"}  # Added more browsers
-RUNNING_ANIMS = {RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R}
+# Start offset (ms from sequence start) of IDLE_CLIPS[i + 1]
+IDLE_SCHEDULE = tuple(itertools.accumulate(IDLE_TIMEOUTS))
+
+CHROME_NAMES = frozenset({"chrome.exe", "msedge.exe", "firefox.exe", "brave.exe"})  # Added more browsers
+RUNNING_ANIMS = frozenset({RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R})
+
+# Hashed membership sets for the checks update_state runs every tick
+IDLE_CLIPS_SET = frozenset(IDLE_CLIPS)
+SPECIAL_ANIMS = frozenset({CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING})  # Stickman stays put while these play
+GROUND_MOVE = frozenset({RUN_LEFT, RUN_RIGHT, WALK_LEFT, WALK_RIGHT})
+RUN_ANIMS = frozenset({RUN_LEFT, RUN_RIGHT})
+RUN_IDLES = frozenset({RUN_IDLE_L, RUN_IDLE_R})
+RUN2SLOW_ANIMS = frozenset({RUN2SLOW_L, RUN2SLOW_R})
+CHROME_ANIMS = frozenset({ENJOY, WATCHING})
+CHROME_STATES = frozenset({"enjoying", "watching"})
+CLICK_ANIMS = frozenset((CLICK_SINGLE, CLICK_DOUBLE))
+FINISH_ANIMS = frozenset((ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R))  # Play once; the last frame drives state
+# Clips nothing can trigger on this machine: Chrome clips need the foreground check, clicks need the mouse hook
+UNREACHABLE_CLIPS = ((frozenset() if HAS_WIN32 and (HAS_WINDLL or HAS_PSUTIL) else CHROME_ANIMS)
+                     | (frozenset() if HAS_WINDLL else CLICK_ANIMS))
 
 # Optimized display sizes
 SIZE_IDLE = QSize(100, 200)
 SIZE_RUN = QSize(150, 200)
+WINDOW_WIDTH = SIZE_RUN.width()  # The overlay is fixed at SIZE_RUN, so update_state needn't ask Qt
+HALF_WINDOW_WIDTH = WINDOW_WIDTH // 2
+
+# Decoded clips shared by every overlay instance: (name, width, height) -> (pixmaps, delays_ms)
+PIXMAP_CACHE = {}
+
+
+def clip_size(name):
+    """Display size a clip is decoded at"""
+    return SIZE_RUN if name in RUNNING_ANIMS else SIZE_IDLE
 
 
 # Background thread for system monitoring
-class SystemMonitorThread(QThread):
+class SystemMonitor(QObject):
+    """Checks the foreground window when it changes, or from a timer without the hook; lives on its own QThread"""
     chrome_status_changed = pyqtSignal(bool)
 
-    def __init__(self):
-        super().__init__()
-        self.running = True
+    def __init__(self, parent=None):
+        super().__init__(parent)
         self.check_interval = 5.0  # Keep at 5 seconds as requested
+        self.max_check_interval = 15.0  # Backoff cap while the Chrome state stays the same
+        self.interval = self.check_interval
+        self.last_chrome_state = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setTimerType(Qt.CoarseTimer)
+        self.timer.timeout.connect(self.check)
+        self._pid_name_cache = {}  # (pid, thread id) -> (exe name, expiry)
+        self._last_hwnd = 0  # Foreground window of the previous check and its answer
+        self._last_result = False
+        self._last_hwnd_expiry = 0.0
+        self._name_buf = ctypes.create_unicode_buffer(260) if HAS_WINDLL else None
+        self._event_hook = None
+        self._event_proc = WinEventProc(self.on_foreground_event) if HAS_WINDLL else None  # Keep a reference
+
+    @pyqtSlot()
+    def start(self):
+        # Foreground switches are the only way the answer can change, so let Windows report them;
+        # the out-of-context callback is delivered through this thread's event loop, which pumps messages
+        if HAS_WINDLL and HAS_WIN32:
+            self._event_hook = user32.SetWinEventHook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND, None,
+                                                      self._event_proc, 0, 0, WINEVENT_OUTOFCONTEXT)
+            if not self._event_hook:
+                log.warning("Warning: SetWinEventHook failed, polling the foreground window")
+        self.timer.start(0)
+
+    def on_foreground_event(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+        self.check()
+
+    @pyqtSlot()
+    def check(self):
+        # A decorated slot, so timer.timeout is delivered on the monitor thread rather than through
+        # a proxy left on the thread that connected it
+        try:
+            current_chrome_state = self.is_chrome_active_window()
 
-    def run(self):
-        last_chrome_state = False
-
-        while self.running:
-            try:
-                current_chrome_state = self.is_chrome_active_window()
-
-                # Only emit signal if state changed
-                if current_chrome_state != last_chrome_state:
-                    self.chrome_status_changed.emit(current_chrome_state)
-                    last_chrome_state = current_chrome_state
+            # Only emit signal if state changed; back off 1.5x while nothing changes
+            if current_chrome_state != self.last_chrome_state:
+                self.last_chrome_state = current_chrome_state
+                self.interval = self.check_interval
+                self.chrome_status_changed.emit(current_chrome_state)
+            else:
+                self.interval = min(self.interval * 1.5, self.max_check_interval)
 
-                self.msleep(int(self.check_interval * 1000))
+            if not self._event_hook:
+                self.timer.start(int(self.interval * 1000))
 
-            except Exception as e:
-                print(f"System monitor error: {e}")
-                self.msleep(1000)
+        except Exception as e:
+            log.error("System monitor error: %s", e)
+            if not self._event_hook:
+                self.timer.start(1000)
 
     def is_chrome_active_window(self):
         """Optimized Chrome detection"""
-        if not HAS_WIN32 or not HAS_PSUTIL:
+        if not HAS_WIN32:
             return False
 
         try:
@@ -154,78 +276,320 @@ class SystemMonitorThread(QThread):
             if hwnd == 0:
                 return False
 
-            _, pid = win32process.GetWindowThreadProcessId(hwnd)
+            # Same foreground window as last time: skip the pid and name lookups entirely
+            now = time.monotonic()
+            if hwnd == self._last_hwnd and now < self._last_hwnd_expiry:
+                return self._last_result
 
-            # Cache process info to avoid repeated lookups
-            if not hasattr(self, '_process_cache'):
-                self._process_cache = {}
+            # The owning thread id comes for free and changes when a PID is reused by a new
+            # process, so it stands in for the process creation time in the cache key
+            key = win32process.GetWindowThreadProcessId(hwnd)
+            pid = key[1]
 
-            if pid not in self._process_cache:
-                try:
-                    process = psutil.Process(pid)
-                    self._process_cache[pid] = process.name().lower()
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    return False
+            cached = self._pid_name_cache.get(key)
+            if cached and cached[1] > now:
+                return self._remember(hwnd, cached[0] in CHROME_NAMES, now)
+
+            name = self.get_process_name(pid)
+            if name is None:
+                return False
 
-            return self._process_cache[pid] in CHROME_NAMES
+            # Drop expired entries before adding so the cache stays small
+            if len(self._pid_name_cache) > 64:
+                self._pid_name_cache = {k: v for k, v in self._pid_name_cache.items() if v[1] > now}
+            self._pid_name_cache[key] = (name, now + PID_NAME_TTL)
+
+            return self._remember(hwnd, name in CHROME_NAMES, now)
 
         except Exception:
             return False
 
+    def _remember(self, hwnd, result, now):
+        """Store the answer for this foreground window and return it"""
+        self._last_hwnd = hwnd
+        self._last_result = result
+        self._last_hwnd_expiry = now + HWND_RESULT_TTL
+        return result
+
+    def get_process_name(self, pid):
+        """Lower-cased exe name via QueryFullProcessImageNameW, psutil only if the process can't be opened"""
+        if HAS_WINDLL:
+            handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+            if handle:
+                try:
+                    size = wintypes.DWORD(len(self._name_buf))
+                    if kernel32.QueryFullProcessImageNameW(handle, 0, self._name_buf, ctypes.byref(size)):
+                        path = self._name_buf.value
+                        return path[path.rfind('\\') + 1:].lower()
+                finally:
+                    kernel32.CloseHandle(handle)
+                # psutil would only repeat the same query on an open handle
+                return None
+
+        if HAS_PSUTIL:
+            import_psutil()
+            try:
+                return psutil.Process(pid).name().lower()
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+
+        return None
+
+    @pyqtSlot()
+    def stop(self):
+        # Runs on the monitor thread: UnhookWinEvent has to come from the thread that set the hook
+        self.timer.stop()
+        if self._event_hook:
+            user32.UnhookWinEvent(self._event_hook)
+            self._event_hook = None
+
+
+# Background thread owning the WH_MOUSE_LL hook and its message loop
+class MouseHookThread(QThread):
+    cursor_activity = pyqtSignal()
+    left_button_down = pyqtSignal(object)  # Event time in ms (32-bit GetTickCount clock, may exceed int)
+    hook_failed = pyqtSignal()  # SetWindowsHookExW failed; the thread has exited and will never report activity
+
+    def __init__(self):
+        super().__init__()
+        self.dirty = False
+        self.pos = array('i', (0, 0))  # Last cursor x, y seen by the hook
+        self.has_pos = False
+        self._thread_id = 0
+        self._hook = None
+        self._proc = LowLevelMouseProc(self._hook_proc)  # Keep a reference so ctypes doesn't free it
+
+    def run(self):
+        self._thread_id = kernel32.GetCurrentThreadId()
+        self._hook = user32.SetWindowsHookExW(WH_MOUSE_LL, self._proc, kernel32.GetModuleHandleW(None), 0)
+        if not self._hook:
+            log.error("Mouse hook error: SetWindowsHookExW failed")
+            self.hook_failed.emit()
+            return
+
+        # The hook callback is dispatched from inside GetMessageW
+        msg = wintypes.MSG()
+        while user32.GetMessageW(ctypes.byref(msg), None, 0, 0) > 0:
+            pass
+
+        user32.UnhookWindowsHookEx(self._hook)
+        self._hook = None
+
+    def _hook_proc(self, n_code, w_param, l_param, cast=ctypes.cast if HAS_WINDLL else None,
+                   call_next=user32.CallNextHookEx if HAS_WINDLL else None):
+        """Record the cursor and flag activity; only the first event after a consumed flag reaches Qt"""
+        # Runs for every mouse event system-wide, so the ctypes helpers are bound as locals above
+        if n_code == HC_ACTION and (w_param == WM_MOUSEMOVE or w_param == WM_LBUTTONDOWN):
+            info = cast(l_param, LP_MSLLHOOKSTRUCT).contents
+            self.pos[0] = info.pt.x
+            self.pos[1] = info.pt.y
+            self.has_pos = True
+            if not self.dirty:
+                self.dirty = True
+                self.cursor_activity.emit()
+            if w_param == WM_LBUTTONDOWN:
+                self.left_button_down.emit(info.time)
+        return call_next(None, n_code, w_param, l_param)
+
     def stop(self):
-        self.running = False
+        if self._thread_id:
+            user32.PostThreadMessageW(self._thread_id, WM_QUIT, 0, 0)
         self.quit()
         self.wait()
 
 
-# Optimized movie loading function
-def safe_movie(path, preload_frames=True):
-    """Create a QMovie with optimized loading"""
+def asset_names():
+    """Names of the files in ASSET_DIR, from one directory scan instead of a stat per clip"""
     try:
-        if not path.exists():
-            print(f"⚠ Missing asset: {path.name}")
-            return None
-
-        mv = QMovie(str(path))
-        if not mv.isValid():
-            print(f"⚠ Invalid movie file: {path.name}")
-            return None
+        with os.scandir(ASSET_DIR) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
 
-        # Optimize caching strategy
-        mv.setCacheMode(QMovie.CacheAll)
 
-        # Pre-jump to first frame for faster startup
-        if preload_frames:
-            mv.jumpToFrame(0)
+def read_frames(path, size, cancelled=None):
+    """Decode every frame of a GIF at the given size into (images, delays_ms)"""
+    # "_grid" marks the grid layout; older single-column sheets lost every frame past y = 32767
+    cache_path = FRAME_CACHE_DIR / f"{path.stem}_{size.width()}x{size.height()}_grid.png"
+    images, delays = read_frame_cache(cache_path, path, size)
+    if images:
+        return images, delays
 
-        return mv
+    try:
+        reader = QImageReader(str(path))
+        reader.setScaledSize(size)
+        while reader.canRead():
+            if cancelled and cancelled():
+                return [], []
+            image = reader.read()
+            if image.isNull():
+                break
+            images.append(image)
+            delays.append(reader.nextImageDelay() or 100)
+
+        if not images:
+            log.warning("⚠ Invalid movie file: %s", path.name)
 
     except Exception as e:
-        print(f"⚠ Error loading {path.name}: {e}")
-        return None
+        log.warning("⚠ Error loading %s: %s", path.name, e)
+
+    if images:
+        write_frame_cache(cache_path, images, delays)
+    return images, delays
+
+
+def frame_sheet_columns(count):
+    """Columns of the near-square grid a clip's frames are cached in"""
+    return math.isqrt(count - 1) + 1
+
+
+def read_frame_cache(cache_path, source, size):
+    """Load a cached sprite sheet if it is newer than its GIF, else ([], [])"""
+    try:
+        if not cache_path.exists() or cache_path.stat().st_mtime < source.stat().st_mtime:
+            return [], []
+        # PNG loads as straight ARGB32; convert here on the loader thread, as fromImage would on the GUI thread
+        sheet = QImage(str(cache_path)).convertToFormat(QImage.Format_ARGB32_Premultiplied)
+        delays = [int(delay) for delay in sheet.text("delays").split(",") if delay]
+        if sheet.isNull() or not delays:
+            return [], []
+        width, height = size.width(), size.height()
+        columns = frame_sheet_columns(len(delays))
+        rows = -(-len(delays) // columns)
+        if sheet.width() != width * columns or sheet.height() != height * rows:
+            return [], []
+        return [sheet.copy((i % columns) * width, (i // columns) * height, width, height)
+                for i in range(len(delays))], delays
+    except (OSError, ValueError):
+        return [], []
+
+
+def write_frame_cache(cache_path, images, delays):
+    """Save decoded frames as one PNG grid with the delays in a text chunk"""
+    try:
+        width, height = images[0].width(), images[0].height()
+        columns = frame_sheet_columns(len(images))
+        rows = -(-len(images) // columns)
+        if width * columns > FRAME_SHEET_MAX_PX or height * rows > FRAME_SHEET_MAX_PX:
+            log.warning("⚠ %s has too many frames to cache", cache_path.name)
+            return
+        sheet = QImage(width * columns, height * rows, QImage.Format_ARGB32_Premultiplied)
+        sheet.fill(Qt.transparent)
+        painter = QPainter(sheet)
+        for i, image in enumerate(images):
+            painter.drawImage((i % columns) * width, (i // columns) * height, image)
+        painter.end()
+        sheet.setText("delays", ",".join(map(str, delays)))
+        FRAME_CACHE_DIR.mkdir(exist_ok=True)
+        if not sheet.save(str(cache_path), "PNG"):
+            log.warning("⚠ Could not write frame cache %s", cache_path.name)
+    except OSError as e:
+        log.warning("⚠ Could not write frame cache %s: %s", cache_path.name, e)
+
+
+class FrameLoaderThread(QThread):
+    """Decode animation clips off the GUI thread, in the order they are requested"""
+    clip_ready = pyqtSignal(str, list, list)
+    queue_drained = pyqtSignal()
+
+    def __init__(self):
+        super().__init__()
+        self.queue = queue.SimpleQueue()
+        self.requested = set()  # Only touched from the GUI thread
+
+    def request(self, name):
+        """Queue a clip for decoding unless it was asked for before"""
+        if name not in self.requested:
+            self.requested.add(name)
+            self.queue.put(name)
+
+    def run(self):
+        while not self.isInterruptionRequested():
+            name = self.queue.get()
+            if name is None:
+                return
+            images, delays = read_frames(ASSET_DIR / name, clip_size(name), self.isInterruptionRequested)
+            if images:
+                self.clip_ready.emit(name, images, delays)
+            if self.queue.empty():
+                self.queue_drained.emit()
+
+    def stop(self):
+        self.requestInterruption()
+        self.queue.put(None)  # Wake a thread blocked on an empty queue
+        self.wait()
 
 
-class OptimizedStickmanOverlay(QLabel):
+def follow_step(cursor_x, stickman_mx, elapsed_ms, half_width, max_x):
+    """Integer movement math for one tick:
+    (new stickman milli-px, clamped window x, px distance before the step, cursor is to the right)"""
+    cursor_mx = cursor_x * 1000
+    heading_right = cursor_mx > stickman_mx
+    distance_m = abs(cursor_mx - stickman_mx)
+    if distance_m > 20000:
+        # Smooth movement with interpolation; speed and elapsed time are both in thousandths
+        move_m = min(distance_m * FOLLOW_SPEED_MILLI * elapsed_ms // 1000000, distance_m)
+        stickman_mx = stickman_mx + move_m if heading_right else stickman_mx - move_m
+    # Clamped with plain comparisons, upper bound first so a screen narrower than the window pins at 0
+    window_x = stickman_mx // 1000 - half_width
+    if window_x > max_x:
+        window_x = max_x
+    if window_x < 0:
+        window_x = 0
+    # Distance is rounded up so the caller's whole-pixel thresholds match the exact value
+    return stickman_mx, window_x, -(-distance_m // 1000), heading_right
+
+
+if HAS_NUMBA:
+    # Compiled on first call and cached next to the script
+    follow_step = njit(cache=True)(follow_step)
+
+
+def get_cursor_pos():
+    """Return the cursor position as an (x, y) tuple of ints"""
+    pos = QCursor.pos()
+    return pos.x(), pos.y()
+
+
+class OptimizedStickmanOverlay(QWidget):
+    # Attributes update_state reads every tick get slot storage; sip keeps __dict__ for everything else
+    __slots__ = ("clock", "frame_count", "last_fps_ms", "chrome_state", "cursor_stationary", "cur_name",
+                 "last_cursor_pos", "mouse_hook", "anim_timer", "last_cursor_move_ms", "movement_locked",
+                 "chrome_fixed_position", "stickman_mx", "last_step_ms", "speed_ema", "cursor_fast", "max_x",
+                 "current_direction", "fixed_y", "moved_x", "moved_y", "movies", "running_idle_start_time",
+                 "run_start_ms")
+
     def __init__(self):
         super().__init__()
 
         # Performance tracking
         self.frame_count = 0
-        self.last_fps_time = time.time()
+        self.clock = QElapsedTimer()  # One monotonic ms clock for every timestamp below
+        self.clock.start()
+        self.last_fps_ms = 0
 
         # Optimized state tracking
         self.movies = {}
-        self.scaled_movies = {}  # Cache for scaled movies
+        self.clip_durations = {}  # name -> total ms, summed once when the clip is stored
         self.idle_sequence_index = 0
+        self.idle_start_ms = 0
         self.cur_name = None
-        self.current_movie = None
+        self.current_frames = []
+        self.current_delays = []
+        self.frame_index = 0
+        self.frame = None  # Pixmap paintEvent draws
+        self.frame_x = 0  # Left edge that centres the current clip in the window
+        self.frame_loader = None
+        self.lazy_clips = []
 
         # Movement optimization
-        self.last_cursor_pos = None
-        self.stickman_x = 500.0  # Use float for smoother movement
+        self.last_cursor_pos = array('i', (0, 0))  # Previous cursor x, y; written in place every tick
+        self.stickman_mx = 500000  # Stickman x in milli-pixels: integer math that keeps sub-pixel progress
+        self.moved_x = self.moved_y = -1  # Last position passed to move(), compared without asking Qt
         self.target_x = 500.0
-        self.vel_timer = QElapsedTimer()
+        self.last_step_ms = 0  # clock ms of the last follow step; the speed and step are timed from it
         self.fixed_y = 0
+        self.max_x = 0  # Rightmost window x on the primary screen; refreshed only when it changes
 
         # Chrome state
         self.is_chrome_active = False
@@ -234,29 +598,40 @@ class OptimizedStickmanOverlay(QLabel):
         self.chrome_fixed_position = None
 
         # Running state
-        self.running_idle_start_time = None
+        self.running_idle_start_time = None  # clock ms when the running idle began
+        self.run_start_ms = 0  # clock ms when the current running clip began
         self.current_direction = "right"
         self.movement_locked = False
 
         # Optimized cursor tracking
-        self.last_cursor_move_time = time.time()
+        self.last_cursor_move_ms = 0  # clock ms of the last cursor move
         self.cursor_stationary = False
-        self.cursor_speed_history = []  # For smoothed speed calculation
+        self.speed_ema = 0.0  # Smoothed cursor px/s; alpha 0.15 gives a half-life of about 4 ticks
+        self.cursor_fast = False  # Result of the previous tick's fast test, for the hysteresis band
 
         # Click detection optimization
-        self.last_click_time = 0
-        self.double_click_threshold = 0.4
-        self.last_mouse_state = False
-        self.click_debounce_time = 0.1  # Prevent rapid clicks
-        self.last_processed_click = 0
+        self.last_click_ms = None  # Time of the last handled click, None until the first
+        self.double_click_threshold = 400  # ms
+        self.click_debounce_time = 80  # ms; presses closer than this are hardware bounce
 
         # Timers
         self.setup_timers()
 
-        # Background thread for system monitoring
-        self.system_monitor = SystemMonitorThread()
+        # Foreground window monitoring on its own thread, so a slow process lookup never stalls
+        # the GUI; only state changes come back, as queued signals
+        self.monitor_thread = QThread(self)
+        self.system_monitor = SystemMonitor()
+        self.system_monitor.moveToThread(self.monitor_thread)
+        self.monitor_thread.started.connect(self.system_monitor.start)
         self.system_monitor.chrome_status_changed.connect(self.on_chrome_status_changed)
 
+        # Low-level mouse hook lets update_state skip ticks while the cursor rests
+        self.mouse_hook = MouseHookThread() if HAS_WINDLL else None
+        if self.mouse_hook:
+            self.mouse_hook.cursor_activity.connect(self.on_cursor_activity)
+            self.mouse_hook.left_button_down.connect(self.on_left_button_down)
+            self.mouse_hook.hook_failed.connect(self.on_mouse_hook_failed)
+
         try:
             self.setup_ui()
             self.load_animations()
@@ -264,21 +639,20 @@ class OptimizedStickmanOverlay(QLabel):
             self.setup_shortcuts()
 
             # Start background monitoring
-            self.system_monitor.start()
+            self.monitor_thread.start()
+            if self.mouse_hook:
+                self.mouse_hook.start()
 
-            # Start with first idle animation
-            self.set_animation(IDLE_CLIPS[0])
+            # The first idle animation starts from on_clip_ready once decoded
             self.show()
 
         except Exception as e:
-            print(f"Initialization error: {e}")
-            traceback.print_exc()
+            log.exception("Initialization error: %s", e)
             self.cleanup()
 
     def setup_ui(self):
         """Optimized UI setup"""
         self.setFixedSize(SIZE_RUN)
-        self.setAlignment(Qt.AlignCenter)
         self.setWindowFlags(
             Qt.FramelessWindowHint |
             Qt.WindowStaysOnTopHint |
@@ -286,86 +660,104 @@ class OptimizedStickmanOverlay(QLabel):
             Qt.WindowDoesNotAcceptFocus
         )
         self.setAttribute(Qt.WA_TranslucentBackground)
-        self.setScaledContents(False)
 
         # Enable hardware acceleration if available
         self.setAttribute(Qt.WA_NativeWindow, True)
 
     def load_animations(self):
         """Optimized animation loading with caching"""
-        all_clips = list(itertools.chain(IDLE_CLIPS, [
-            WALK_LEFT, WALK_RIGHT, RUN_LEFT, RUN_RIGHT,
-            RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R,
-            CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING
-        ]))
-
-        print("🎬 Loading animations...")
+        log.info("🎬 Loading animations...")
         self.movies = {}
-        self.scaled_movies = {}
-
-        # Load movies in priority order (idle first, then common animations)
-        priority_clips = IDLE_CLIPS + [WALK_LEFT, WALK_RIGHT, CLICK_SINGLE, CLICK_DOUBLE]
-
-        for name in priority_clips:
-            movie = safe_movie(ASSET_DIR / name, preload_frames=True)
-            if movie:
-                self.movies[name] = movie
-                # Pre-cache scaled versions
-                self.cache_scaled_movie(name, movie)
-
-        # Load remaining animations
-        for name in all_clips:
-            if name not in self.movies:
-                movie = safe_movie(ASSET_DIR / name, preload_frames=False)
-                if movie:
-                    self.movies[name] = movie
-
-        available_idles = [clip for clip in IDLE_CLIPS if clip in self.movies]
+
+        present = asset_names()
+        existing_clips = []
+        for name in ALL_CLIPS:
+            if name in UNREACHABLE_CLIPS:
+                continue  # Never decoded, so never held in memory
+            if name in present:
+                existing_clips.append(name)
+            else:
+                log.warning("⚠ Missing asset: %s", name)
+
+        available_idles = [clip for clip in IDLE_CLIPS if clip in existing_clips]
         if not available_idles:
             raise Exception("No idle animations found!")
 
-        print(f"✅ Loaded {len(self.movies)} animations")
+        # The later idle clips are the bulk of the frames and only play after a long rest,
+        # so they are decoded when an idle sequence starts rather than at startup
+        self.lazy_clips = available_idles[1:]
+
+        self.frame_loader = FrameLoaderThread()
+        self.frame_loader.clip_ready.connect(self.on_clip_ready)
+        self.frame_loader.queue_drained.connect(lambda: log.info("✅ Loaded %d animations", len(self.movies)))
 
-    def cache_scaled_movie(self, name, movie):
-        """Cache scaled versions of movies for faster switching"""
-        if name in RUNNING_ANIMS:
-            movie.setScaledSize(SIZE_RUN)
-            self.scaled_movies[name] = SIZE_RUN
+        # Decode in priority order (first idle, then common animations); clips become playable as they arrive
+        priority_clips = [available_idles[0], WALK_LEFT, WALK_RIGHT, CLICK_SINGLE, CLICK_DOUBLE]
+        for name in itertools.chain(priority_clips, existing_clips):
+            if name in existing_clips and name not in self.lazy_clips:
+                self.request_clip(name)
+        self.frame_loader.start()
+
+    def request_clip(self, name):
+        """Take a clip from the shared cache, or queue it for decoding"""
+        if name in self.movies:
+            return
+        size = clip_size(name)
+        cached = PIXMAP_CACHE.get((name, size.width(), size.height()))
+        if cached:
+            self.store_clip(name, cached)
         else:
-            movie.setScaledSize(SIZE_IDLE)
-            self.scaled_movies[name] = SIZE_IDLE
+            self.frame_loader.request(name)
+
+    def on_clip_ready(self, name, images, delays):
+        """Cache a decoded clip; pixmaps are created here on the GUI thread"""
+        size = clip_size(name)
+        clip = ([QPixmap.fromImage(image) for image in images], delays)
+        PIXMAP_CACHE[(name, size.width(), size.height())] = clip
+        self.store_clip(name, clip)
+
+    def store_clip(self, name, clip):
+        """Make a clip playable, starting the first idle clip if nothing is showing yet"""
+        self.movies[name] = clip
+        self.clip_durations[name] = sum(clip[1])
+        if self.cur_name is None and name in IDLE_CLIPS_SET:
+            self.set_animation(name)
+            # The cursor may have come to rest while nothing was showing yet
+            self.start_idle_sequence()
 
     def setup_timers(self):
         """Optimized timer setup"""
-        # Main animation timer - back to 30 FPS for optimal balance
+        # Main update loop - 16 ms (~60 Hz) while active, TICK_IDLE_MS while parked
         self.anim_timer = QTimer(self)
         self.anim_timer.timeout.connect(self.update_state)
-        self.anim_timer.start(33)  # 30 FPS - sweet spot for performance vs smoothness
-
-        # Idle animation timer
-        self.idle_timer = QTimer()
-        self.idle_timer.setSingleShot(True)
-        self.idle_timer.timeout.connect(self.play_next_idle)
-
-        # Chrome enjoy timer
-        self.enjoy_timer = QTimer()
-        self.enjoy_timer.setSingleShot(True)
-        self.enjoy_timer.timeout.connect(self.start_watching)
-
-        # Click animation timers
-        self.click_timer_single = QTimer()
-        self.click_timer_single.setSingleShot(True)
-        self.click_timer_single.timeout.connect(lambda: self.force_stop_click_animation(CLICK_SINGLE))
-
-        self.click_timer_double = QTimer()
-        self.click_timer_double.setSingleShot(True)
-        self.click_timer_double.timeout.connect(lambda: self.force_stop_click_animation(CLICK_DOUBLE))
-
-        # Optimized click detection timer
-        if HAS_WIN32API:
-            self.click_timer = QTimer(self)
-            self.click_timer.timeout.connect(self.detect_click)
-            self.click_timer.start(33)  # Reduced from 50ms for better responsiveness
+        self.anim_timer.start(TICK_ACTIVE_MS)  # Slowed or stopped while the stickman is parked
+        self.app_hidden = False
+        # The overlay never takes focus, so Inactive is its normal state; only stop ticking
+        # while the whole application is hidden or suspended
+        QApplication.instance().applicationStateChanged.connect(self.on_application_state_changed)
+
+        # Frame timer - re-armed with each frame's own delay
+        self.frame_timer = QTimer(self)
+        self.frame_timer.setSingleShot(True)
+        self.frame_timer.timeout.connect(self.advance_frame)
+
+        # Transition timer - the next idle clip, the end of a click clip and enjoy -> watching
+        # never overlap, so one single-shot timer carries whichever is pending
+        self.transition_timer = QTimer(self)
+        self.transition_timer.setSingleShot(True)
+        self.transition_timer.timeout.connect(self.run_transition)
+        self.pending_transition = None
+
+    def schedule_transition(self, delay_ms, handler):
+        """Run handler after delay_ms, replacing any pending transition"""
+        self.pending_transition = handler
+        self.transition_timer.start(delay_ms)
+
+    def run_transition(self):
+        """Fire the pending transition"""
+        handler, self.pending_transition = self.pending_transition, None
+        if handler:
+            handler()
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -378,194 +770,222 @@ class OptimizedStickmanOverlay(QLabel):
             self.debug_shortcut.activated.connect(self.show_debug_info)
 
         except Exception as e:
-            print(f"Shortcut setup error: {e}")
+            log.error("Shortcut setup error: %s", e)
 
     def show_debug_info(self):
         """Show performance debug information"""
-        current_time = time.time()
-        elapsed = current_time - self.last_fps_time
+        elapsed = (self.clock.elapsed() - self.last_fps_ms) / 1000.0
         if elapsed > 0:
             fps = self.frame_count / elapsed
-            print(f"🔧 FPS: {fps:.1f}, Animation: {self.cur_name}, Chrome: {self.chrome_state}")
+            log.info("🔧 FPS: %.1f, Animation: %s, Chrome: %s", fps, self.cur_name, self.chrome_state)
 
     def on_chrome_status_changed(self, is_active):
         """Handle Chrome status change from background thread"""
-        current_time = time.time()
-
         if is_active and not self.is_chrome_active:
-            print("🌐 Chrome detected!")
+            log.debug("🌐 Chrome detected!")
             self.is_chrome_active = True
-            self.chrome_first_detected_time = current_time
+            self.chrome_first_detected_time = self.clock.elapsed()
             self.chrome_fixed_position = (self.x(), self.y())
             self.chrome_state = "enjoying"
             self.reset_idle_sequence()
 
             if ENJOY in self.movies:
                 self.set_animation(ENJOY)
-                self.enjoy_timer.start(ENJOY_DURATION)
+                self.schedule_transition(self.clip_durations.get(ENJOY, ENJOY_DURATION), self.start_watching)
 
         elif not is_active and self.is_chrome_active:
-            print("🌐 Chrome closed")
+            log.debug("🌐 Chrome closed")
             self.is_chrome_active = False
             self.chrome_state = "none"
             self.chrome_first_detected_time = None
             self.chrome_fixed_position = None
+            # Cursor speed from before Chrome came up says nothing about the cursor now
+            self.speed_ema = 0.0
+            self.cursor_fast = False
 
-            if self.cur_name in (ENJOY, WATCHING):
+            if self.cur_name in CHROME_ANIMS:
                 self.return_to_idle_1()
 
-    def detect_click(self):
-        """Optimized click detection with debouncing"""
-        try:
-            if not HAS_WIN32API:
-                return
+        # A stopped update loop has to notice the new Chrome state to unpark
+        self.wake_update_loop()
 
-            current_time = time.time()
+    def on_left_button_down(self, event_ms=None):
+        """Handle a left-button press stamped with the hook's event time (the overlay clock if None)"""
+        try:
+            now_ms = self.clock.elapsed() if event_ms is None else event_ms
+            # Masked so the 32-bit tick count wrapping between two clicks still gives the gap
+            since_last_click = ((now_ms - self.last_click_ms) & 0xFFFFFFFF
+                                if self.last_click_ms is not None else self.double_click_threshold)
 
-            # Debounce rapid clicks
-            if current_time - self.last_processed_click < self.click_debounce_time:
+            # Debounce hardware bounce
+            if since_last_click < self.click_debounce_time:
                 return
 
-            current_mouse_state = win32api.GetKeyState(win32con.VK_LBUTTON) < 0
-
-            if current_mouse_state and not self.last_mouse_state:
-                if (not self.movement_locked and
-                        self.chrome_state == "none" and
-                        self.cur_name not in [ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R]):
+            if (not self.movement_locked and
+                    self.chrome_state == "none" and
+                    self.cur_name not in FINISH_ANIMS):
 
-                    # Check for double click
-                    if current_time - self.last_click_time < self.double_click_threshold:
-                        if CLICK_DOUBLE in self.movies:
-                            self.reset_idle_sequence()
-                            self.set_animation(CLICK_DOUBLE)
-                            self.click_timer_double.start(CLICK_DOUBLE_DURATION)
-                    else:
-                        if CLICK_SINGLE in self.movies:
-                            self.reset_idle_sequence()
-                            self.set_animation(CLICK_SINGLE)
-                            self.click_timer_single.start(CLICK_SINGLE_DURATION)
-
-                    self.last_click_time = current_time
-                    self.last_processed_click = current_time
+                # Check for double click
+                if since_last_click < self.double_click_threshold:
+                    if CLICK_DOUBLE in self.movies:
+                        self.reset_idle_sequence()
+                        self.set_animation(CLICK_DOUBLE)
+                        self.schedule_transition(self.clip_durations.get(CLICK_DOUBLE, CLICK_DOUBLE_DURATION),
+                                                 self.force_stop_click_animation)
+                else:
+                    if CLICK_SINGLE in self.movies:
+                        self.reset_idle_sequence()
+                        self.set_animation(CLICK_SINGLE)
+                        self.schedule_transition(self.clip_durations.get(CLICK_SINGLE, CLICK_SINGLE_DURATION),
+                                                 self.force_stop_click_animation)
 
-            self.last_mouse_state = current_mouse_state
+                self.last_click_ms = now_ms
 
         except Exception as e:
-            print(f"Click detection error: {e}")
+            log.error("Click detection error: %s", e)
 
     def set_animation(self, clip_name):
         """Optimized animation switching"""
         try:
-            if clip_name == self.cur_name or clip_name not in self.movies:
+            if clip_name == self.cur_name:
                 return
-
-            movie = self.movies[clip_name]
-            if not movie or not movie.isValid():
+            # One lookup; None also covers clips that are missing or still decoding
+            clip = self.movies.get(clip_name)
+            if clip is None:
                 return
 
-            # Stop current movie
-            if self.current_movie:
-                self.current_movie.stop()
-                try:
-                    self.current_movie.finished.disconnect()
-                except:
-                    pass
-
-            # Use cached scaling if available
-            if clip_name not in self.scaled_movies:
-                self.cache_scaled_movie(clip_name, movie)
-
-            # Set new movie
+            self.frame_timer.stop()
             self.cur_name = clip_name
-            self.current_movie = movie
-            self.setMovie(movie)
-
-            # Connect signals only for necessary animations
-            if clip_name in [ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R]:
-                movie.finished.connect(lambda: self.on_animation_finished(clip_name))
-
-            movie.start()
+            self.current_frames, self.current_delays = clip
+            self.frame_index = 0
+            self.frame_x = (WINDOW_WIDTH - self.current_frames[0].width()) // 2
+            self.show_frame(self.current_frames[0])
+            self.frame_timer.start(self.current_delays[0])
 
         except Exception as e:
-            print(f"Animation error: {e}")
+            log.error("Animation error: %s", e)
+
+    def advance_frame(self):
+        """Show the next pre-decoded frame of the current clip"""
+        index = self.frame_index + 1
+        if index == len(self.current_frames):
+            if self.cur_name in FINISH_ANIMS:
+                # One-shot clips hold their last frame and hand over to the state machine
+                self.on_animation_finished(self.cur_name)
+                return
+            index = 0
+        self.frame_index = index
+        self.show_frame(self.current_frames[index])
+        self.frame_timer.start(self.current_delays[index])
+
+    def show_frame(self, pixmap):
+        """Make pixmap the current frame and schedule a repaint"""
+        self.frame = pixmap
+        self.update()
+
+    def paintEvent(self, event):
+        """Draw the current frame straight onto the transparent window"""
+        if self.frame is not None:
+            painter = QPainter(self)
+            painter.drawPixmap(self.frame_x, 0, self.frame)
 
     def update_state(self):
         """Optimized main update loop"""
         try:
             # Performance tracking
             self.frame_count += 1
-            current_time = time.time()
+            now_ms = self.clock.elapsed()
 
-            if current_time - self.last_fps_time > 5.0:  # Reset every 5 seconds
-                self.last_fps_time = current_time
+            if now_ms - self.last_fps_ms > 5000:  # Reset every 5 seconds
+                self.last_fps_ms = now_ms
                 self.frame_count = 0
 
-            if not HAS_PYAUTOGUI:
-                return
-
-            # Get cursor position (cached to avoid repeated calls)
-            try:
-                cursor_pos = pyautogui.position()
-            except Exception:
-                return
-
-            if not self.last_cursor_pos:
-                self.last_cursor_pos = cursor_pos
-                return
+            # A parked stickman only needs a slow tick: pinned in place while Chrome is in front
+            # (cursor moves there just update the bookkeeping below), or idle next to a resting cursor
+            if self.chrome_state in CHROME_STATES or (
+                    self.cursor_stationary and self.cur_name in IDLE_CLIPS_SET
+                    and abs(self.last_cursor_pos[0] * 1000 - self.stickman_mx) <= 20000):
+                if self.anim_timer.interval() != TICK_IDLE_MS:
+                    self.anim_timer.setInterval(TICK_IDLE_MS)
+                # With the mouse hook running there is nothing to poll until it reports activity,
+                # so stop ticking altogether; on_cursor_activity and Chrome changes restart the loop.
+                # A hook thread that has exited reports nothing, so the slow tick polls the cursor instead
+                if self.mouse_hook and self.mouse_hook.isRunning() and not self.mouse_hook.dirty:
+                    self.anim_timer.stop()
+                    return
+            elif self.anim_timer.interval() != TICK_ACTIVE_MS:
+                # Unparked without the cursor moving (e.g. Chrome closed), so catch up at full rate
+                self.anim_timer.setInterval(TICK_ACTIVE_MS)
+            if self.mouse_hook:
+                self.mouse_hook.dirty = False
+
+            # Get cursor position as plain ints; the hook already has it without a syscall
+            if self.mouse_hook and self.mouse_hook.has_pos:
+                cursor_x, cursor_y = self.mouse_hook.pos
+            else:
+                cursor_x, cursor_y = get_cursor_pos()
 
             # Optimized cursor movement detection
-            dx = cursor_pos.x - self.last_cursor_pos.x
-            dy = cursor_pos.y - self.last_cursor_pos.y
+            dx = cursor_x - self.last_cursor_pos[0]
+            dy = cursor_y - self.last_cursor_pos[1]
             cursor_moved = abs(dx) > 1 or abs(dy) > 1  # Threshold to avoid micro-movements
 
             if cursor_moved:
-                self.last_cursor_move_time = current_time
+                self.last_cursor_move_ms = now_ms
                 if self.cursor_stationary:
                     self.cursor_stationary = False
-                    if self.cur_name in IDLE_CLIPS and self.chrome_state == "none":
+                    self.anim_timer.setInterval(TICK_ACTIVE_MS)
+                    if self.cur_name in IDLE_CLIPS_SET and self.chrome_state == "none":
                         self.reset_idle_sequence()
             else:
                 # Cursor stationary check
-                if current_time - self.last_cursor_move_time > 1.0:
+                if now_ms - self.last_cursor_move_ms > 1000:
                     if not self.cursor_stationary:
                         self.cursor_stationary = True
                         if (self.chrome_state == "none" and not self.movement_locked
                                 and self.cur_name == IDLE_CLIPS[0]):
                             self.start_idle_sequence()
 
-            # Handle Chrome mode
-            if self.chrome_state in ["enjoying", "watching"] and self.chrome_fixed_position:
-                if self.x() != self.chrome_fixed_position[0] or self.y() != self.chrome_fixed_position[1]:
-                    self.move(self.chrome_fixed_position[0], self.chrome_fixed_position[1])
-                self.last_cursor_pos = cursor_pos
+            # Handle Chrome mode - pinned where Chrome was detected, so there is nothing to move
+            if self.chrome_state in CHROME_STATES and self.chrome_fixed_position:
+                self.last_cursor_pos[0] = cursor_x
+                self.last_cursor_pos[1] = cursor_y
                 return
 
             # Skip movement for special animations
-            if (self.cur_name in (CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING)
-                    or self.movement_locked):
-                self.last_cursor_pos = cursor_pos
+            if self.cur_name in SPECIAL_ANIMS or self.movement_locked:
+                self.last_cursor_pos[0] = cursor_x
+                self.last_cursor_pos[1] = cursor_y
+                return
+
+            # Idle beside a cursor that has not moved: no step, clip switch or window move can follow
+            if (not cursor_moved and self.cur_name in IDLE_CLIPS_SET
+                    and -20000 <= cursor_x * 1000 - self.stickman_mx <= 20000):
+                self.last_step_ms = now_ms  # The next move is timed from here, not from the last step
+                self.cursor_fast = False
+                self.last_cursor_pos[0] = cursor_x
+                self.last_cursor_pos[1] = cursor_y
                 return
 
             # Optimized movement calculation
-            elapsed_ms = max(1, self.vel_timer.restart())
-            elapsed_s = elapsed_ms / 1000.0
+            elapsed_ms = max(1, now_ms - self.last_step_ms)
+            self.last_step_ms = now_ms
 
-            # Smooth cursor speed calculation
+            # Smooth cursor speed with an EMA; a single float is all a few samples need
+            is_fast = False
             if cursor_moved:
-                cursor_speed = abs(dx) / elapsed_s
-                self.cursor_speed_history.append(cursor_speed)
-                if len(self.cursor_speed_history) > 5:  # Keep last 5 samples
-                    self.cursor_speed_history.pop(0)
-                avg_cursor_speed = sum(self.cursor_speed_history) / len(self.cursor_speed_history)
-            else:
-                avg_cursor_speed = 0
+                speed = (dx if dx >= 0 else -dx) * 1000 / elapsed_ms
+                self.speed_ema = 0.85 * self.speed_ema + 0.15 * speed
+                is_fast = self.speed_ema >= (FAST_CURSOR_SPEED_LO if self.cursor_fast else FAST_CURSOR_SPEED)
+            self.cursor_fast = is_fast
 
             # Smooth stickman movement
-            distance_to_cursor = abs(cursor_pos.x - self.stickman_x)
+            self.stickman_mx, target_screen_x, distance_to_cursor, heading_right = follow_step(
+                cursor_x, self.stickman_mx, elapsed_ms, HALF_WINDOW_WIDTH, self.max_x)
 
             if distance_to_cursor > 20:
                 # Determine direction
-                new_direction = "right" if cursor_pos.x > self.stickman_x else "left"
+                new_direction = "right" if heading_right else "left"
 
                 if new_direction != self.current_direction and self.cur_name in RUNNING_ANIMS:
                     self.movement_locked = False
@@ -573,190 +993,223 @@ class OptimizedStickmanOverlay(QLabel):
 
                 self.current_direction = new_direction
 
-                # Smooth movement with interpolation
-                move_amount = min(distance_to_cursor * STICKMAN_FOLLOW_SPEED * elapsed_s, distance_to_cursor)
-
-                if cursor_pos.x > self.stickman_x:
-                    self.stickman_x += move_amount
-                else:
-                    self.stickman_x -= move_amount
-
-            # Update visual position - removed overly aggressive optimization
-            screen_width = pyautogui.size().width
-            target_screen_x = max(0, min(int(self.stickman_x) - self.width() // 2,
-                                         screen_width - self.width()))
-
-            # Always update position for smooth movement
-            self.move(target_screen_x, self.fixed_y)
+            # Update position, batching 1 px steps into 2 px ones; the settled position is always applied exactly
+            step_x = target_screen_x - self.moved_x
+            if (step_x >= MIN_MOVE_PX or step_x <= -MIN_MOVE_PX
+                    or -20000 <= cursor_x * 1000 - self.stickman_mx <= 20000):
+                self.move_to(target_screen_x, self.fixed_y)
 
             # Optimized animation logic
-            if avg_cursor_speed >= FAST_CURSOR_SPEED and cursor_moved and distance_to_cursor > 100:
-                run_anim = RUN_RIGHT if self.current_direction == "right" else RUN_LEFT
-                if run_anim in self.movies and not self.movement_locked:
+            # Name checks come first so a steady walk or run makes no set_animation call at all
+            if is_fast and distance_to_cursor > 100:
+                facing_right = self.current_direction == "right"
+                run_anim = RUN_RIGHT if facing_right else RUN_LEFT
+                # Already in this direction's running loop: keep it rather than restarting the run clip
+                if (self.cur_name != run_anim and self.cur_name != (RUN_IDLE_R if facing_right else RUN_IDLE_L)
+                        and run_anim in self.movies and not self.movement_locked):
                     self.set_animation(run_anim)
-                    self.movement_locked = False
-                    QTimer.singleShot(800, self.start_running_idle)
+                    self.run_start_ms = now_ms
 
             elif cursor_moved and distance_to_cursor > 20:
                 walk_anim = WALK_RIGHT if self.current_direction == "right" else WALK_LEFT
-                if walk_anim in self.movies and not self.movement_locked:
+                if self.cur_name != walk_anim and walk_anim in self.movies and not self.movement_locked:
                     self.set_animation(walk_anim)
 
             elif distance_to_cursor <= 30:
-                if self.cur_name in [RUN_LEFT, RUN_RIGHT, WALK_LEFT, WALK_RIGHT]:
+                if self.cur_name in GROUND_MOVE:
                     self.return_to_idle()
-                elif self.cur_name in [RUN_IDLE_L, RUN_IDLE_R]:
-                    if (self.running_idle_start_time and
-                            current_time - self.running_idle_start_time > RUN_IDLE_MAX_TIME):
+                elif self.cur_name in RUN_IDLES:
+                    if (self.running_idle_start_time is not None and
+                            now_ms - self.running_idle_start_time > RUN_IDLE_MAX_TIME * 1000):
                         slow_anim = RUN2SLOW_R if self.current_direction == "right" else RUN2SLOW_L
                         if slow_anim in self.movies:
                             self.movement_locked = True
                             self.set_animation(slow_anim)
 
-            self.last_cursor_pos = cursor_pos
+            # Checked on this tick rather than with a single-shot timer armed every fast tick
+            if self.cur_name in RUN_ANIMS and now_ms - self.run_start_ms >= RUN_TO_IDLE_MS:
+                self.start_running_idle()
+
+            self.last_cursor_pos[0] = cursor_x
+            self.last_cursor_pos[1] = cursor_y
 
         except Exception as e:
-            print(f"State update error: {e}")
+            log.error("State update error: %s", e)
+
+    def on_application_state_changed(self, state):
+        """Pause the update loop while the application is hidden or suspended"""
+        self.app_hidden = state in (Qt.ApplicationHidden, Qt.ApplicationSuspended)
+        if self.app_hidden:
+            self.anim_timer.stop()
+        else:
+            self.wake_update_loop()
+
+    def on_mouse_hook_failed(self):
+        """Fall back to polling the cursor when the mouse hook could not be installed"""
+        self.mouse_hook = None
+        self.wake_update_loop()  # The loop may have stopped while parked, waiting on the hook
+
+    def on_cursor_activity(self):
+        """Wake the update loop as soon as the mouse hook reports movement"""
+        # Pinned for Chrome: leave the hook flagged and let the Chrome-closed wake catch up
+        if self.chrome_state in CHROME_STATES and self.chrome_fixed_position:
+            return
+        self.wake_update_loop()
+
+    def wake_update_loop(self):
+        """Run update_state at the active rate again if it was slowed or stopped"""
+        if self.app_hidden:
+            return
+        if not self.anim_timer.isActive() or self.anim_timer.interval() != TICK_ACTIVE_MS:
+            self.anim_timer.start(TICK_ACTIVE_MS)
+            self.update_state()
 
     # [Rest of the methods remain largely the same but with minor optimizations]
 
     def reset_idle_sequence(self):
-        """Reset idle animation sequence"""
+        """Reset idle animation sequence and drop whatever transition was pending"""
         self.idle_sequence_index = 0
-        self.idle_timer.stop()
+        self.transition_timer.stop()
+        self.pending_transition = None
 
     def play_next_idle(self):
         """Play next idle animation"""
         if not self.cursor_stationary or self.movement_locked or self.chrome_state != "none":
             return
 
-        if self.idle_sequence_index < len(IDLE_CLIPS):
-            animation = IDLE_CLIPS[self.idle_sequence_index]
-            self.set_animation(animation)
-            self.idle_sequence_index += 1
-
-            if self.idle_sequence_index >= len(IDLE_CLIPS):
-                self.idle_sequence_index = len(IDLE_CLIPS) - 1
-
-            self.schedule_next_idle()
-
-    def schedule_next_idle(self):
-        """Schedule next idle animation"""
-        if not self.cursor_stationary or self.chrome_state != "none":
-            return
+        index = self.idle_sequence_index
+        self.set_animation(IDLE_CLIPS[index])
 
-        timeout_index = max(0, self.idle_sequence_index - 1)
-        if timeout_index < len(IDLE_TIMEOUTS):
-            timeout = IDLE_TIMEOUTS[timeout_index]
-            if timeout > 0:
-                self.idle_timer.start(timeout)
+        # The last idle clip loops on its own; the others switch at fixed offsets from sequence start
+        if index < len(IDLE_CLIPS) - 1:
+            self.idle_sequence_index = index + 1
+            elapsed_ms = self.clock.elapsed() - self.idle_start_ms
+            self.schedule_transition(max(0, IDLE_SCHEDULE[index] - elapsed_ms), self.play_next_idle)
 
     def start_idle_sequence(self):
         """Start idle sequence"""
         if self.cursor_stationary and self.chrome_state == "none" and not self.movement_locked:
+            for name in self.lazy_clips:
+                self.request_clip(name)  # No-op once loaded or requested
             self.idle_sequence_index = 0
+            self.idle_start_ms = self.clock.elapsed()
             self.play_next_idle()
 
     def return_to_idle_1(self):
         """Return to first idle animation"""
         self.reset_idle_sequence()
-        if IDLE_CLIPS[0] in self.movies:
-            self.set_animation(IDLE_CLIPS[0])
+        self.set_animation(IDLE_CLIPS[0])
 
     def return_to_idle(self):
         """Return to idle sequence"""
         self.reset_idle_sequence()
         if IDLE_CLIPS[0] in self.movies:
             self.set_animation(IDLE_CLIPS[0])
-            QTimer.singleShot(1000, self.start_idle_sequence)
+            self.schedule_transition(1000, self.start_idle_sequence)
 
     def start_running_idle(self):
         """Start running idle"""
         try:
-            if self.cur_name in [RUN_LEFT, RUN_RIGHT] and not self.movement_locked:
+            if self.cur_name in RUN_ANIMS and not self.movement_locked:
                 idle_anim = RUN_IDLE_R if self.current_direction == "right" else RUN_IDLE_L
                 if idle_anim in self.movies:
                     self.set_animation(idle_anim)
-                    self.running_idle_start_time = time.time()
+                    self.running_idle_start_time = self.clock.elapsed()
         except Exception as e:
-            print(f"Running idle error: {e}")
+            log.error("Running idle error: %s", e)
 
     def start_watching(self):
         """Start watching animation"""
         self.chrome_state = "watching"
-        if WATCHING in self.movies:
-            self.set_animation(WATCHING)
+        self.set_animation(WATCHING)
 
     def on_animation_finished(self, clip_name):
         """Handle animation completion"""
         try:
             if clip_name == ENJOY:
                 self.chrome_state = "watching"
-                if WATCHING in self.movies:
-                    self.set_animation(WATCHING)
+                self.set_animation(WATCHING)
             elif clip_name == WATCHING:
-                if self.is_chrome_active and self.chrome_state == "watching":
-                    if WATCHING in self.movies:
-                        self.set_animation(WATCHING)
-                else:
+                # While Chrome is active the last watching frame simply stays up
+                if not (self.is_chrome_active and self.chrome_state == "watching"):
                     self.chrome_state = "none"
                     self.chrome_fixed_position = None
                     self.return_to_idle_1()
-            elif clip_name in [RUN2SLOW_L, RUN2SLOW_R]:
+            elif clip_name in RUN2SLOW_ANIMS:
                 self.movement_locked = False
                 self.running_idle_start_time = None
                 self.return_to_idle_1()
         except Exception as e:
-            print(f"Animation finish error: {e}")
+            log.error("Animation finish error: %s", e)
 
-    def force_stop_click_animation(self, expected_clip):
+    def force_stop_click_animation(self):
         """Force stop click animation"""
         try:
-            if self.cur_name == expected_clip:
+            if self.cur_name in CLICK_ANIMS:
                 self.return_to_idle_1()
         except Exception as e:
-            print(f"Force stop error: {e}")
+            log.error("Force stop error: %s", e)
 
     def setup_position(self):
         """Setup initial position"""
         try:
-            if HAS_PYAUTOGUI:
-                screen_size = pyautogui.size()
-                self.fixed_y = screen_size.height - SIZE_RUN.height() - 50
-                cursor_pos = pyautogui.position()
-                self.last_cursor_pos = cursor_pos
-                self.stickman_x = float(cursor_pos.x)  # Use float for precision
-                self.vel_timer.start()
+            QApplication.instance().primaryScreenChanged.connect(self.watch_screen)
+            QApplication.primaryScreen().geometryChanged.connect(self.on_screen_changed)
+            self.on_screen_changed()  # Caches the bounds update_state clamps against every tick
+            cursor_x, cursor_y = get_cursor_pos()
+            self.last_cursor_pos[0] = cursor_x
+            self.last_cursor_pos[1] = cursor_y
+            self.stickman_mx = cursor_x * 1000
+            self.last_step_ms = self.clock.elapsed()
         except Exception as e:
-            print(f"Position setup error: {e}")
+            log.error("Position setup error: %s", e)
+            self.max_x = QApplication.primaryScreen().size().width() - WINDOW_WIDTH
             self.fixed_y = 100
-            self.last_cursor_pos = type('pos', (), {'x': 500, 'y': 100})()
-            self.stickman_x = 500.0
+            self.last_cursor_pos[0] = 500
+            self.last_cursor_pos[1] = 100
+            self.stickman_mx = 500000
+
+    def watch_screen(self, screen):
+        """Follow a new primary screen so resolution changes on it refresh the cache too"""
+        screen.geometryChanged.connect(self.on_screen_changed)
+        self.on_screen_changed()
+
+    def move_to(self, x, y):
+        """Move the window, skipping the Qt call when it is already there"""
+        if x == self.moved_x and y == self.moved_y:
+            return
+        self.move(x, y)
+        self.moved_x, self.moved_y = x, y
+
+    def on_screen_changed(self, *_):
+        """Refresh the cached screen metrics after a display change"""
+        try:
+            geometry = QApplication.primaryScreen().geometry()  # Same logical pixels as QCursor and move()
+            self.max_x = geometry.width() - WINDOW_WIDTH
+            self.fixed_y = geometry.height() - SIZE_RUN.height() - 50
+        except Exception as e:
+            log.error("Screen change error: %s", e)
 
     def cleanup(self):
         """Enhanced cleanup"""
         try:
-            # Stop system monitor thread
-            if hasattr(self, 'system_monitor'):
-                self.system_monitor.stop()
-
-            # Stop all timers
-            timers = ['anim_timer', 'idle_timer', 'enjoy_timer', 'click_timer',
-                      'click_timer_single', 'click_timer_double']
-            for timer_name in timers:
-                if hasattr(self, timer_name):
-                    getattr(self, timer_name).stop()
+            # Stop system monitor
+            if hasattr(self, 'monitor_thread') and self.monitor_thread.isRunning():
+                QMetaObject.invokeMethod(self.system_monitor, "stop", Qt.BlockingQueuedConnection)
+                self.monitor_thread.quit()
+                self.monitor_thread.wait()
+            if getattr(self, 'mouse_hook', None):
+                self.mouse_hook.stop()
 
-            # Stop movies
-            if self.current_movie:
-                self.current_movie.stop()
+            # Stop all timers - every timer is parented to the overlay
+            for timer in self.findChildren(QTimer):
+                timer.stop()
 
-            for movie in self.movies.values():
-                if movie:
-                    movie.stop()
+            if self.frame_loader:
+                self.frame_loader.stop()
 
         except Exception as e:
-            print(f"Cleanup error: {e}")
+            log.error("Cleanup error: %s", e)
 
     def safe_exit(self):
         """Safe application exit"""
@@ -764,7 +1217,7 @@ class OptimizedStickmanOverlay(QLabel):
             self.cleanup()
             QApplication.quit()
         except Exception as e:
-            print(f"Exit error: {e}")
+            log.error("Exit error: %s", e)
             sys.exit(0)
 
     def closeEvent(self, event):
@@ -780,8 +1233,8 @@ def main():
         app.setQuitOnLastWindowClosed(True)
 
         def handle_exception(exc_type, exc_value, exc_traceback):
-            print(f"Unhandled exception: {exc_type.__name__}: {exc_value}")
-            traceback.print_exception(exc_type, exc_value, exc_traceback)
+            log.error("Unhandled exception: %s: %s", exc_type.__name__, exc_value,
+                      exc_info=(exc_type, exc_value, exc_traceback))
 
         sys.excepthook = handle_exception
 
@@ -789,8 +1242,7 @@ def main():
         sys.exit(app.exec_())
 
     except Exception as e:
-        print(f"Application error: {e}")
-        traceback.print_exc()
+        log.exception("Application error: %s", e)
         sys.exit(1)
 
 
@@ -6,55 +6,112 @@ The inspiration from those animations led me to coding these following lines
 
 # Importing the Header Files
 
+import os
 import sys
-import time
-import itertools
+import functools
+import importlib.util
 import pathlib
 import traceback
-from PyQt5.QtCore import Qt, QTimer, QSize, QElapsedTimer
+from PyQt5.QtCore import (Qt, QTimer, QSize, QElapsedTimer, QRunnable, QThreadPool,
+                          QMetaObject, Q_ARG, pyqtSlot)
 from PyQt5.QtGui import QMovie, QKeySequence
 from PyQt5.QtWidgets import QApplication, QLabel, QShortcut
 
 
 # Safe Imports with Fallbacks set for error detection
 try:
-    import psutil
     import win32gui
     import win32process
-    HAS_PSUTIL = True
     HAS_WIN32 = True
-except ImportError as e:
-    if 'win32' in str(e):
-        HAS_WIN32 = False
-        print("Warning: win32gui not available, using basic browser detection")
-        try:
-            import psutil
-            HAS_PSUTIL = True
-        except ImportError:
-            HAS_PSUTIL = False
-            print("Warning: psutil not available, browser detection disabled")
-    else:
-        HAS_PSUTIL = False
-        HAS_WIN32 = False
-        print("Warning: psutil not available, browser detection disabled")
-
-try:
-    import pyautogui
-    pyautogui.FAILSAFE = False  # Disable failsafe
-    HAS_PYAUTOGUI = True
 except ImportError:
-    HAS_PYAUTOGUI = False
-    print("Error: pyautogui is required")
-    sys.exit(1)
+    HAS_WIN32 = False
+    print("Warning: win32gui not available, browser detection disabled")
+
+# psutil only backs up the native exe-name lookup, so it is found here but imported on first use
+psutil = None
+HAS_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+def import_psutil():
+    """Import psutil the first time the native lookup can't answer"""
+    global psutil
+    if psutil is None:
+        import psutil as module
+        psutil = module
+    return psutil
 
-# Import win32api for click detection
+
+# Native Win32 access: the foreground hook and exe-name lookup for the Chrome check (HAS_WINDLL),
+# then Raw Input for click detection, where WM_INPUT only arrives when a button changes (HAS_RAWINPUT)
+HAS_WINDLL = HAS_RAWINPUT = False
 try:
-    import win32api
-    import win32con
-    HAS_WIN32API = True
-except ImportError:
-    HAS_WIN32API = False
-    print("Warning: win32api not available, click detection disabled")
+    import ctypes
+    from ctypes import wintypes
+
+    kernel32 = ctypes.windll.kernel32
+    kernel32.OpenProcess.argtypes = (wintypes.DWORD, wintypes.BOOL, wintypes.DWORD)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.QueryFullProcessImageNameW.argtypes = (wintypes.HANDLE, wintypes.DWORD, wintypes.LPWSTR,
+                                                    ctypes.POINTER(wintypes.DWORD))
+    kernel32.CloseHandle.argtypes = (wintypes.HANDLE,)
+    user32 = ctypes.windll.user32
+    WinEventProc = ctypes.WINFUNCTYPE(None, wintypes.HANDLE, wintypes.DWORD, wintypes.HWND, wintypes.LONG,
+                                      wintypes.LONG, wintypes.DWORD, wintypes.DWORD)
+    user32.SetWinEventHook.argtypes = (wintypes.DWORD, wintypes.DWORD, wintypes.HMODULE, WinEventProc,
+                                       wintypes.DWORD, wintypes.DWORD, wintypes.DWORD)
+    user32.SetWinEventHook.restype = wintypes.HANDLE
+    user32.UnhookWinEvent.argtypes = (wintypes.HANDLE,)
+    HAS_WINDLL = True
+
+    class RAWINPUTDEVICE(ctypes.Structure):
+        _fields_ = [("usUsagePage", wintypes.USHORT), ("usUsage", wintypes.USHORT),
+                    ("dwFlags", wintypes.DWORD), ("hwndTarget", wintypes.HWND)]
+
+    class RAWINPUTHEADER(ctypes.Structure):
+        _fields_ = [("dwType", wintypes.DWORD), ("dwSize", wintypes.DWORD),
+                    ("hDevice", wintypes.HANDLE), ("wParam", wintypes.WPARAM)]
+
+    class RAWMOUSE(ctypes.Structure):
+        # usButtonFlags/usButtonData share a ULONG-aligned union with ulButtons
+        _fields_ = [("usFlags", wintypes.USHORT), ("_pad", wintypes.USHORT),
+                    ("usButtonFlags", wintypes.USHORT), ("usButtonData", wintypes.USHORT),
+                    ("ulRawButtons", wintypes.ULONG), ("lLastX", wintypes.LONG),
+                    ("lLastY", wintypes.LONG), ("ulExtraInformation", wintypes.ULONG)]
+
+    class RAWINPUT(ctypes.Structure):
+        _fields_ = [("header", RAWINPUTHEADER), ("mouse", RAWMOUSE)]
+
+    user32.RegisterRawInputDevices.argtypes = (ctypes.POINTER(RAWINPUTDEVICE), wintypes.UINT, wintypes.UINT)
+    user32.GetRawInputData.argtypes = (wintypes.HANDLE, wintypes.UINT, ctypes.c_void_p,
+                                       ctypes.POINTER(wintypes.UINT), wintypes.UINT)
+    user32.GetRawInputData.restype = wintypes.UINT
+    user32.GetCursorPos.argtypes = (ctypes.POINTER(wintypes.POINT),)
+    CURSOR_POINT = wintypes.POINT()  # Reused by every GetCursorPos call
+    CURSOR_POINT_PTR = ctypes.pointer(CURSOR_POINT)
+    HAS_RAWINPUT = True
+except (ImportError, AttributeError, OSError):
+    pass  # Whichever flags were set before the failure stay set
+if not HAS_RAWINPUT:
+    print("Warning: Raw Input not available, click detection disabled")
+
+WM_INPUT = 0x00FF
+RID_INPUT = 0x10000003
+RIM_TYPEMOUSE = 0
+RIDEV_INPUTSINK = 0x00000100  # Deliver input even while another window has focus
+RI_MOUSE_LEFT_BUTTON_DOWN = 0x0001
+
+# pyautogui is only the cursor fallback where GetCursorPos can't be called, so it isn't imported otherwise
+if not HAS_RAWINPUT:
+    try:
+        import pyautogui
+        pyautogui.FAILSAFE = False  # Disable failsafe
+    except ImportError:
+        print("Error: pyautogui is required")
+        sys.exit(1)
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+EVENT_SYSTEM_FOREGROUND = 0x0003
+WINEVENT_OUTOFCONTEXT = 0x0000
+BROWSER_POLL_MS = 5000  # Chrome check interval when no foreground hook is available
 
 ASSET_DIR = pathlib.Path(__file__).parent
 
@@ -79,12 +136,16 @@ WATCHING = "watching.gif"
 
 # Create IDLE_CLIPS list from the individual constants
 IDLE_CLIPS = [IDLE_CLIP_1, IDLE_CLIP_2, IDLE_CLIP_3, IDLE_CLIP_4, IDLE_CLIP_5]
+ALL_CLIPS = (*IDLE_CLIPS, WALK_LEFT, WALK_RIGHT, RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R,
+             RUN2SLOW_L, RUN2SLOW_R, CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING)
 
 # Speed Values and Control Panel
 WALK_VEL = 50
 FAST_CURSOR_SPEED = 400
+FAST_CURSOR_SPEED_LO = 300  # Hysteresis: once fast, the cursor stays fast until the EMA drops below this
 RUN_IDLE_MAX_TIME = 5
 STICKMAN_FOLLOW_SPEED = 3.0
+FOLLOW_SPEED_MILLI = int(STICKMAN_FOLLOW_SPEED * 1000)  # Integer form used by update_state
 
 # Fixed timing values for idle animations (in milliseconds)
 IDLE_ANIMATION_TIMEOUT_1 = int(40.9 * 1000)
@@ -109,21 +170,49 @@ IDLE_TIMEOUTS = [
     IDLE_ANIMATION_TIMEOUT_5
 ]
 
-CHROME_NAMES = {"chrome.exe"}
-RUNNING_ANIMS = {RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R}
+CHROME_NAMES = frozenset({"chrome.exe"})
+PROCESS_CACHE_SIZE = 256  # psutil.Process objects kept for reuse across Chrome checks
+RUNNING_ANIMS = frozenset({RUN_LEFT, RUN_RIGHT, RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R})
+FINISH_ANIMS = frozenset({ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R})  # Clips whose end drives state
+HOT_ANIMS = frozenset({IDLE_CLIP_1, WALK_LEFT, WALK_RIGHT})  # Opened and warmed at startup; the rest on first play
+
+# Hashed membership sets for the checks update_state runs every tick
+IDLE_CLIPS_SET = frozenset(IDLE_CLIPS)
+SPECIAL_ANIMS = frozenset({CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING})  # Stickman stays put while these play
+GROUND_MOVE = frozenset({RUN_LEFT, RUN_RIGHT, WALK_LEFT, WALK_RIGHT})
+RUN_ANIMS = frozenset({RUN_LEFT, RUN_RIGHT})
+RUN_IDLES = frozenset({RUN_IDLE_L, RUN_IDLE_R})
+RUN2SLOW_ANIMS = frozenset({RUN2SLOW_L, RUN2SLOW_R})
+CHROME_ANIMS = frozenset({ENJOY, WATCHING})
+CHROME_STATES = frozenset({"enjoying", "watching"})
+HAS_CHROME_CHECK = HAS_WIN32 and (HAS_WINDLL or HAS_PSUTIL)
+# Clips nothing can trigger on this machine: Chrome clips need the foreground check, clicks need Raw Input
+UNREACHABLE_CLIPS = ((frozenset() if HAS_CHROME_CHECK else CHROME_ANIMS)
+                     | (frozenset() if HAS_RAWINPUT else frozenset({CLICK_SINGLE, CLICK_DOUBLE})))
 
 # Target display sizes
 SIZE_IDLE = QSize(100, 200)
 SIZE_RUN = QSize(150, 200)
+WINDOW_WIDTH = SIZE_RUN.width()  # The overlay is fixed at SIZE_RUN, so update_state needn't ask Qt
+HALF_WINDOW_WIDTH = WINDOW_WIDTH // 2
+
+# Update loop rates (ms between ticks)
+TICK_ACTIVE_MS = 33  # 30 FPS
+TICK_IDLE_MS = 400  # Parked next to a resting cursor
+WARM_FRAME_MS = 100  # One frame is decoded ahead of time per tick after startup
+
+def asset_names():
+    """Names of the files in ASSET_DIR, from one directory scan instead of a stat per clip"""
+    try:
+        with os.scandir(ASSET_DIR) as entries:
+            return {entry.name for entry in entries if entry.is_file()}
+    except OSError:
+        return set()
 
 # QMOVIE FUNCTION
 def safe_movie(path):
     """Create a QMovie with proper error handling"""
     try:
-        if not path.exists():
-            print(f"⚠ Missing asset: {path.name}")
-            return None
-
         mv = QMovie(str(path))
         if not mv.isValid():
             print(f"⚠ Invalid movie file: {path.name}")
@@ -135,27 +224,83 @@ def safe_movie(path):
         print(f"⚠ Error loading {path.name}: {e}")
         return None
 
+def get_process_name(pid):
+    """Lower-cased exe name via QueryFullProcessImageNameW; None if the process can't be opened"""
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        # Per-call buffer: Chrome probes run on the thread pool
+        buf = ctypes.create_unicode_buffer(260)
+        size = wintypes.DWORD(len(buf))
+        if kernel32.QueryFullProcessImageNameW(handle, 0, buf, ctypes.byref(size)):
+            path = buf.value
+            return path[path.rfind('\\') + 1:].lower()
+    finally:
+        kernel32.CloseHandle(handle)
+    # psutil would only repeat the same query on an open handle, so don't fall back to it
+    return ""
+
+# Runs one Chrome check on the thread pool and hands the result back to the overlay
+class ChromeProbe(QRunnable):
+    def __init__(self, target):
+        super().__init__()
+        self.target = target
+
+    def run(self):
+        active = self.target.is_chrome_active_window()
+        QMetaObject.invokeMethod(self.target, "on_chrome_result", Qt.QueuedConnection, Q_ARG(bool, active))
+
+def get_cursor_pos():
+    """Return the cursor position as an (x, y) tuple of ints"""
+    if not HAS_RAWINPUT:
+        return tuple(pyautogui.position())  # pyautogui is only imported in this case
+    # GetCursorPos fails on a locked workstation or the secure desktop and leaves the POINT untouched,
+    # so the last known position comes back until the desktop returns
+    user32.GetCursorPos(CURSOR_POINT_PTR)
+    return CURSOR_POINT.x, CURSOR_POINT.y
+
 #Creating a Class
 class StickmanOverlay(QLabel):
+    debounce_ms = 80  # Presses closer than this are hardware bounce; tune per mouse
+    # Attributes update_state reads every tick get slot storage; sip keeps __dict__ for everything else
+    __slots__ = ("raw_input_active", "mouse_dirty", "last_cursor_x", "last_cursor_y", "clock", "last_cursor_move_ms",
+                 "cursor_stationary", "cur_name", "chrome_state", "chrome_fixed_position", "movement_locked",
+                 "anim_timer", "last_step_ms", "speed_ema", "cursor_fast", "stickman_mx", "current_direction",
+                 "max_x", "fixed_y", "moved_x", "moved_y", "movies", "run_idle_timer", "running_idle_start_time")
+
     def __init__(self):
         super().__init__()
 
         # Initialize all attributes first
         self.movies = {}
+        self.warm_queue = []  # Clip names whose frame caches still need filling, next one last
         self.idle_sequence_index = 0  # Track position in idle sequence (0-4)
+        self.idle_sequence = []  # (clip, timeout ms) for each idle clip that loaded, in order
         self.cur_name = None
         self.current_movie = None
-        self.last_cursor_pos = None
-        self.stickman_x = 500
-        self.vel_timer = QElapsedTimer()
+        self.last_cursor_x = self.last_cursor_y = None  # Two ints rather than a tuple per tick
+        self.stickman_mx = 500000  # Thousandths of a pixel
+        self.moved_x = self.moved_y = -1  # Last position passed to move(), compared without asking Qt
+        self.last_step_ms = 0  # clock ms of the last follow step; the speed and step are timed from it
+        self.clock = QElapsedTimer()  # Monotonic ms clock for every timestamp; no wall-clock syscalls
+        self.clock.start()
+        self.speed_ema = 0.0  # Cursor speed in px/s, smoothed over a few ticks
+        self.cursor_fast = False  # Result of the previous tick's fast test, for the hysteresis band
         self.fixed_y = 0
+        self.max_x = 0  # Rightmost window x on the primary screen; refreshed only when it changes
         self.is_chrome_active = False
         self.chrome_state = "none"  # "none", "enjoying", "watching"
         self.chrome_first_detected_time = None
         self.chrome_fixed_position = None  # Store position when Chrome is detected
+        self.chrome_probe_pending = False  # Don't queue a new probe while one is still running
+        self.chrome_probe_again = False  # The foreground changed while a probe ran, so its answer may be stale
+        self.foreground_hook = None  # EVENT_SYSTEM_FOREGROUND hook; runs check_chrome_active on each switch
+        self.process_cache = {}  # pid -> psutil.Process, oldest first
+        self.fg_cache = (0, 0, False)  # (hwnd, pid, is Chrome) from the last probe
 
         # Running state tracking
-        self.running_idle_start_time = None
+        self.running_idle_start_time = None  # clock ms when the running idle began
         self.current_direction = "right"
         self.movement_locked = False
 
@@ -164,6 +309,12 @@ class StickmanOverlay(QLabel):
         self.idle_timer.setSingleShot(True)
         self.idle_timer.timeout.connect(self.play_next_idle)
 
+        # Run → running idle hand-off; one reusable timer instead of a singleShot per run start
+        self.run_idle_timer = QTimer()
+        self.run_idle_timer.setSingleShot(True)
+        self.run_idle_timer.setInterval(800)
+        self.run_idle_timer.timeout.connect(self.start_running_idle)
+
         # Chrome enjoy timer
         self.enjoy_timer = QTimer()
         self.enjoy_timer.setSingleShot(True)
@@ -172,20 +323,24 @@ class StickmanOverlay(QLabel):
         # Click animation timer
         self.click_timer_single = QTimer()
         self.click_timer_single.setSingleShot(True)
-        self.click_timer_single.timeout.connect(lambda: self.force_stop_click_animation(CLICK_SINGLE))
+        self.click_timer_single.timeout.connect(functools.partial(self.force_stop_click_animation, CLICK_SINGLE))
 
         self.click_timer_double = QTimer()
         self.click_timer_double.setSingleShot(True)
-        self.click_timer_double.timeout.connect(lambda: self.force_stop_click_animation(CLICK_DOUBLE))
+        self.click_timer_double.timeout.connect(functools.partial(self.force_stop_click_animation, CLICK_DOUBLE))
 
         # Cursor movement detection
-        self.last_cursor_move_time = time.time()
+        self.last_cursor_move_ms = 0
         self.cursor_stationary = False
 
-        # Click detection with win32api
-        self.last_click_time = 0
-        self.double_click_threshold = 0.4  # seconds
-        self.last_mouse_state = False
+        # Click detection with Raw Input
+        self.last_click_ms = -1000
+        self.double_click_threshold = 400  # ms
+        self.raw_input_active = False  # WM_INPUT registered: mouse movement arrives as messages
+        self.mouse_dirty = True  # Raw mouse input seen since update_state last read the cursor
+        if HAS_RAWINPUT:
+            self.raw_input = RAWINPUT()
+            self.raw_input_size = wintypes.UINT()
 
         try:
             self.setup_ui()
@@ -218,57 +373,122 @@ class StickmanOverlay(QLabel):
 
     def load_animations(self):
         """Load all animation files safely"""
-        all_clips = list(itertools.chain(IDLE_CLIPS, [
-            WALK_LEFT, WALK_RIGHT, RUN_LEFT, RUN_RIGHT,
-            RUN_IDLE_L, RUN_IDLE_R, RUN2SLOW_L, RUN2SLOW_R,
-            CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING
-        ]))
-
+        # Every clip on disk gets a slot; the QMovie itself is only opened on first play
         self.movies = {}
-        for name in all_clips:
-            movie = safe_movie(ASSET_DIR / name)
-            if movie:
-                self.movies[name] = movie
+        present = asset_names()
+        for name in ALL_CLIPS:
+            if name in UNREACHABLE_CLIPS:
+                continue  # Never given a slot, so nothing ever opens it
+            if name in present:
+                self.movies[name] = None
+            else:
+                print(f"⚠ Missing asset: {name}")
 
-        # Check if we have at least one idle animation
-        available_idles = [clip for clip in IDLE_CLIPS if clip in self.movies]
+        # Idle clips play straight away, so open those now
+        available_idles = [clip for clip in IDLE_CLIPS if self.movie_for(clip)]
         if not available_idles:
             raise Exception("No idle animations found!")
 
+        # The idle sequence only walks the clips that loaded, each paired with its own timeout
+        self.idle_sequence = [(clip, timeout) for clip, timeout in zip(IDLE_CLIPS, IDLE_TIMEOUTS)
+                              if clip in available_idles]
+
+        # Hot clips get their frame caches filled in the background so their first play doesn't
+        # decode every frame on the GUI thread; see warm_next_frame
+        self.warm_queue = [name for name in HOT_ANIMS if self.movie_for(name)]
+
+    def movie_for(self, name):
+        """Return the clip's QMovie, opening it on first use; None if it is missing or invalid"""
+        movie = self.movies.get(name)
+        if movie is None and name in self.movies:
+            movie = safe_movie(ASSET_DIR / name)
+            if not movie:
+                del self.movies[name]  # Drop the slot so the "in self.movies" checks skip it
+                return None
+            # Scale once here; frames are then decoded straight at display size
+            movie.setScaledSize(SIZE_RUN if name in RUNNING_ANIMS else SIZE_IDLE)
+            # Connected once for the movie's lifetime; set_animation never touches the connection
+            if name in FINISH_ANIMS:
+                movie.frameChanged.connect(self.on_movie_frame)
+            self.movies[name] = movie
+        return movie
+
+    def move_to(self, x, y):
+        """Move the window, skipping the Qt call when it is already there"""
+        if x == self.moved_x and y == self.moved_y:
+            return
+        self.move(x, y)
+        self.moved_x, self.moved_y = x, y
+
     def setup_position(self):
         """Setup initial position tracking"""
         try:
-            if HAS_PYAUTOGUI:
-                screen_size = pyautogui.size()
-                self.fixed_y = screen_size.height - SIZE_RUN.height() - 50
-                cursor_pos = pyautogui.position()
-                self.last_cursor_pos = cursor_pos
-                self.stickman_x = cursor_pos.x
-                self.vel_timer.start()
+            QApplication.instance().primaryScreenChanged.connect(self.watch_screen)
+            QApplication.primaryScreen().geometryChanged.connect(self.on_screen_changed)
+            self.on_screen_changed()  # Caches the bounds update_state clamps against every tick
+            cursor_x, cursor_y = get_cursor_pos()
+            self.last_cursor_x, self.last_cursor_y = cursor_x, cursor_y
+            self.stickman_mx = cursor_x * 1000
+            self.last_step_ms = self.clock.elapsed()
         except Exception as e:
             print(f"Position setup error: {e}")
+            self.max_x = QApplication.primaryScreen().size().width() - WINDOW_WIDTH
             self.fixed_y = 100
-            self.last_cursor_pos = type('pos', (), {'x': 500, 'y': 100})()
-            self.stickman_x = 500
+            self.last_cursor_x, self.last_cursor_y = 500, 100
+            self.stickman_mx = 500000
+
+    def watch_screen(self, screen):
+        """Follow a new primary screen so resolution changes on it refresh the cache too"""
+        screen.geometryChanged.connect(self.on_screen_changed)
+        self.on_screen_changed()
+
+    def on_screen_changed(self, *_):
+        """Refresh the cached screen metrics after a display change"""
+        try:
+            # Straight from Qt, which already has it, instead of another pyautogui round trip
+            geometry = QApplication.primaryScreen().geometry()
+            self.max_x = geometry.width() - WINDOW_WIDTH
+            self.fixed_y = geometry.height() - SIZE_RUN.height() - 50
+        except Exception as e:
+            print(f"Screen change error: {e}")
 
     def setup_timers(self):
         """Setting up all timers safely"""
         # Main animation timer
         self.anim_timer = QTimer(self)
         self.anim_timer.timeout.connect(self.update_state)
-        self.anim_timer.start(33)  # 30 FPS
-
-        # Click detection timer
-        if HAS_WIN32API:
-            self.click_timer = QTimer(self)
-            self.click_timer.timeout.connect(self.detect_click)
-            self.click_timer.start(50)  # Check every 50ms
-
-        # Chrome check timer - 5 seconds as requested
-        if HAS_PSUTIL and HAS_WIN32:
-            self.browser_timer = QTimer(self)
-            self.browser_timer.timeout.connect(self.check_chrome_active)
-            self.browser_timer.start(5000)  # Check every 5 seconds
+        self.anim_timer.start(TICK_ACTIVE_MS)  # Dropped to TICK_IDLE_MS while parked
+
+        # Frame-cache warmer - stops itself once every hot clip is decoded
+        self.warm_timer = QTimer(self)
+        self.warm_timer.setTimerType(Qt.CoarseTimer)
+        self.warm_timer.timeout.connect(self.warm_next_frame)
+        self.warm_timer.start(WARM_FRAME_MS)
+
+        # Click detection - register for WM_INPUT instead of polling the button state
+        if HAS_RAWINPUT:
+            device = RAWINPUTDEVICE(0x01, 0x02, RIDEV_INPUTSINK, int(self.winId()))  # Generic desktop mouse
+            self.raw_input_active = bool(user32.RegisterRawInputDevices(ctypes.byref(device), 1,
+                                                                        ctypes.sizeof(device)))
+            if not self.raw_input_active:
+                print("Warning: RegisterRawInputDevices failed, click detection disabled")
+
+        # Chrome check - foreground switches come from a WinEvent hook; the timer only polls without one
+        if HAS_CHROME_CHECK:
+            if HAS_WINDLL:
+                self.foreground_proc = WinEventProc(self.on_foreground_event)  # Keep a reference
+                self.foreground_hook = user32.SetWinEventHook(EVENT_SYSTEM_FOREGROUND, EVENT_SYSTEM_FOREGROUND,
+                                                              None, self.foreground_proc, 0, 0,
+                                                              WINEVENT_OUTOFCONTEXT)
+                if not self.foreground_hook:
+                    print("Warning: SetWinEventHook failed, polling for Chrome")
+            if self.foreground_hook:
+                QTimer.singleShot(0, self.check_chrome_active)  # Chrome may already be in front
+            else:
+                self.browser_timer = QTimer(self)
+                self.browser_timer.setTimerType(Qt.CoarseTimer)
+                self.browser_timer.timeout.connect(self.check_chrome_active)
+                self.browser_timer.start(BROWSER_POLL_MS)
 
     def setup_shortcuts(self):
         """Setup keyboard shortcuts"""
@@ -278,43 +498,54 @@ class StickmanOverlay(QLabel):
         except Exception as e:
             print(f"Shortcut setup error: {e}")
 
+    def nativeEvent(self, event_type, message):
+        """Pick mouse activity and left-button presses out of WM_INPUT"""
+        if HAS_RAWINPUT and event_type == b"windows_generic_MSG":
+            msg = wintypes.MSG.from_address(int(message))
+            if msg.message == WM_INPUT:
+                self.raw_input_size.value = ctypes.sizeof(self.raw_input)
+                if (user32.GetRawInputData(msg.lParam, RID_INPUT, ctypes.byref(self.raw_input),
+                                           ctypes.byref(self.raw_input_size),
+                                           ctypes.sizeof(RAWINPUTHEADER)) != 0xFFFFFFFF
+                        and self.raw_input.header.dwType == RIM_TYPEMOUSE):
+                    self.mouse_dirty = True
+                    if self.anim_timer.interval() != TICK_ACTIVE_MS:
+                        self.anim_timer.setInterval(TICK_ACTIVE_MS)
+                    if self.raw_input.mouse.usButtonFlags & RI_MOUSE_LEFT_BUTTON_DOWN:
+                        self.detect_click()
+        return super().nativeEvent(event_type, message)
+
     def detect_click(self):
-        """Detect mouse clicks using win32api - simple and reliable"""
+        """Handle a left-button press reported through Raw Input"""
         try:
-            if not HAS_WIN32API:
-                return
+            # Only trigger click animations during normal states
+            if (not self.movement_locked and
+                self.chrome_state == "none" and
+                self.cur_name not in FINISH_ANIMS):
+
+                now_ms = self.clock.elapsed()
+
+                # Drop hardware bounce before the double-click check
+                if now_ms - self.last_click_ms < self.debounce_ms:
+                    return
+
+                # Check if this is a double click
+                if now_ms - self.last_click_ms < self.double_click_threshold:
+                    if CLICK_DOUBLE in self.movies:
+                        self.reset_idle_sequence()  # Stop idle sequence
+                        self.set_animation(CLICK_DOUBLE)
+                        # Start timer to force stop after exact duration
+                        self.click_timer_double.start(CLICK_DOUBLE_DURATION)
+                        print("🖱️ Double click detected")
+                else:
+                    if CLICK_SINGLE in self.movies:
+                        self.reset_idle_sequence()  # Stop idle sequence
+                        self.set_animation(CLICK_SINGLE)
+                        # Start timer to force stop after exact duration
+                        self.click_timer_single.start(CLICK_SINGLE_DURATION)
+                        print("🖱️ Single click detected")
 
-            # Check if left mouse button is pressed
-            current_mouse_state = win32api.GetKeyState(win32con.VK_LBUTTON) < 0
-
-            # Detect button press (transition from not pressed to pressed)
-            if current_mouse_state and not self.last_mouse_state:
-                # Only trigger click animations during normal states
-                if (not self.movement_locked and
-                    self.chrome_state == "none" and
-                    self.cur_name not in [ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R]):
-
-                    current_time = time.time()
-
-                    # Check if this is a double click
-                    if current_time - self.last_click_time < self.double_click_threshold:
-                        if CLICK_DOUBLE in self.movies:
-                            self.reset_idle_sequence()  # Stop idle sequence
-                            self.set_animation(CLICK_DOUBLE)
-                            # Start timer to force stop after exact duration
-                            self.click_timer_double.start(CLICK_DOUBLE_DURATION)
-                            print("🖱️ Double click detected")
-                    else:
-                        if CLICK_SINGLE in self.movies:
-                            self.reset_idle_sequence()  # Stop idle sequence
-                            self.set_animation(CLICK_SINGLE)
-                            # Start timer to force stop after exact duration
-                            self.click_timer_single.start(CLICK_SINGLE_DURATION)
-                            print("🖱️ Single click detected")
-
-                    self.last_click_time = current_time
-
-            self.last_mouse_state = current_mouse_state
+                self.last_click_ms = now_ms
 
         except Exception as e:
             print(f"Click detection error: {e}")
@@ -331,31 +562,23 @@ class StickmanOverlay(QLabel):
             return
 
         # Play current idle animation
-        if self.idle_sequence_index < len(IDLE_CLIPS):
-            animation = IDLE_CLIPS[self.idle_sequence_index]
+        if self.idle_sequence_index < len(self.idle_sequence):
+            animation = self.idle_sequence[self.idle_sequence_index][0]
             self.set_animation(animation)
             print(f"🎬 Playing {animation} (index {self.idle_sequence_index})")
 
-            # Move to next animation
-            self.idle_sequence_index += 1
-
-            # If we've reached idle_5, keep looping it
-            if self.idle_sequence_index >= len(IDLE_CLIPS):
-                self.idle_sequence_index = len(IDLE_CLIPS) - 1  # Stay on idle_5
-
-            # Schedule next animation
-            self.schedule_next_idle()
+            # idle_5 loops on its own, so once it is up there is nothing left to schedule
+            if self.idle_sequence_index < len(self.idle_sequence) - 1:
+                self.idle_sequence_index += 1
+                self.schedule_next_idle()
 
     def schedule_next_idle(self):
         """Schedule the next idle animation"""
         if not self.cursor_stationary or self.chrome_state != "none":
             return
 
-        # Get timeout for current animation
-        if self.idle_sequence_index < len(IDLE_TIMEOUTS):
-            timeout = IDLE_TIMEOUTS[self.idle_sequence_index - 1] if self.idle_sequence_index > 0 else IDLE_TIMEOUTS[0]
-        else:
-            timeout = IDLE_TIMEOUTS[-2]  # Use timeout 4 for idle_5 loops
+        # Timeout of the clip that just started (the index already points at the next one)
+        timeout = self.idle_sequence[self.idle_sequence_index - 1][1]
 
         if timeout > 0:
             print(f"⏰ Next idle in {timeout/1000:.1f} seconds")
@@ -368,44 +591,59 @@ class StickmanOverlay(QLabel):
             self.idle_sequence_index = 0
             self.play_next_idle()
 
+    def warm_next_frame(self):
+        """Decode the next frame of a hot clip into its CacheAll cache"""
+        while self.warm_queue:
+            movie = self.movies.get(self.warm_queue[-1])
+            # The clip on screen fills its own cache as it plays
+            if movie is None or movie is self.current_movie:
+                self.warm_queue.pop()
+                continue
+            next_frame = movie.currentFrameNumber() + 1
+            if next_frame < movie.frameCount():
+                movie.jumpToFrame(next_frame)
+                return
+            movie.jumpToFrame(0)  # Rewind so the first play starts at the first frame
+            self.warm_queue.pop()
+        self.warm_timer.stop()
+
     def set_animation(self, clip_name):
         """Set animation with proper cleanup"""
         try:
-            if clip_name == self.cur_name or clip_name not in self.movies:
+            if clip_name == self.cur_name:
                 return
 
-            movie = self.movies[clip_name]
+            movie = self.movie_for(clip_name)
             if not movie or not movie.isValid():
                 return
 
             # Stop current movie properly
             if self.current_movie:
                 self.current_movie.stop()
-                try:
-                    self.current_movie.finished.disconnect()
-                except:
-                    pass
 
-            # Scale based on animation type
-            if clip_name in RUNNING_ANIMS:
-                movie.setScaledSize(SIZE_RUN)
-            else:
-                movie.setScaledSize(SIZE_IDLE)
+            # A clip picked mid-warm would otherwise start where warm_next_frame left it
+            if self.warm_queue and self.warm_queue[-1] == clip_name:
+                movie.jumpToFrame(0)
 
             # Set new movie
             self.cur_name = clip_name
             self.current_movie = movie
             self.setMovie(movie)
 
-            # Connect finished signal for special animations (excluding click animations since we handle them with timers)
-            if clip_name in [ENJOY, WATCHING, RUN2SLOW_L, RUN2SLOW_R]:
-                movie.finished.connect(lambda: self.on_animation_finished(clip_name))
-
             movie.start()
 
         except Exception as e:
             print(f"Animation error: {e}")
 
+    @pyqtSlot(int)
+    def on_movie_frame(self, frame_number):
+        """Shared frameChanged slot for one-shot clips; only the current movie counts, so cur_name names it"""
+        # The GIFs loop forever, so QMovie.finished never fires; the last frame marks the end instead
+        movie = self.sender()
+        if movie is self.current_movie and frame_number == movie.frameCount() - 1:
+            movie.setPaused(True)  # Hold the last frame unless the handler switches clips
+            self.on_animation_finished(self.cur_name)
+
     def on_animation_finished(self, clip_name):
         """Handle animation completion"""
         try:
@@ -416,17 +654,14 @@ class StickmanOverlay(QLabel):
                     self.set_animation(WATCHING)
 
             elif clip_name == WATCHING:
-                # Loop watching animation while Chrome is active
-                if self.is_chrome_active and self.chrome_state == "watching":
-                    if WATCHING in self.movies:
-                        self.set_animation(WATCHING)
-                else:
+                # watching.gif is a single frame that plays once; while Chrome is active it simply stays up
+                if not (self.is_chrome_active and self.chrome_state == "watching"):
                     # Chrome no longer active, return to idle
                     self.chrome_state = "none"
                     self.chrome_fixed_position = None
                     self.return_to_idle_1()
 
-            elif clip_name in [RUN2SLOW_L, RUN2SLOW_R]:
+            elif clip_name in RUN2SLOW_ANIMS:
                 self.movement_locked = False
                 self.running_idle_start_time = None
                 self.return_to_idle_1()
@@ -477,31 +712,77 @@ class StickmanOverlay(QLabel):
 
             _, pid = win32process.GetWindowThreadProcessId(hwnd)
 
+            # Same foreground window as the last probe, so the answer cannot have changed
+            fg_hwnd, fg_pid, fg_active = self.fg_cache
+            if hwnd == fg_hwnd and pid == fg_pid:
+                return fg_active
+
+            active = self.is_chrome_pid(pid)
+            self.fg_cache = (hwnd, pid, active)
+            return active
+
+        except Exception:
+            return False
+
+    def is_chrome_pid(self, pid):
+        """Check if the process behind pid is Chrome"""
+        try:
+            if HAS_WINDLL:
+                process_name = get_process_name(pid)
+                if process_name is not None:
+                    return process_name in CHROME_NAMES
+            if not HAS_PSUTIL:
+                return False
+            import_psutil()
+
             try:
-                process = psutil.Process(pid)
-                process_name = process.name().lower()
-                return process_name in CHROME_NAMES
+                # Reuse the Process object; psutil keeps the name it already fetched
+                process = self.process_cache.pop(pid, None)
+                if process is None:
+                    if len(self.process_cache) >= PROCESS_CACHE_SIZE:
+                        del self.process_cache[next(iter(self.process_cache))]
+                    process = psutil.Process(pid)
+                self.process_cache[pid] = process
+                return process.name().lower() in CHROME_NAMES
 
             except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self.process_cache.pop(pid, None)
                 return False
 
         except Exception:
             return False
 
+    def on_foreground_event(self, hook, event, hwnd, id_object, id_child, thread_id, time_ms):
+        # Out-of-context WinEvents are delivered through the GUI thread's message loop
+        self.check_chrome_active()
+
     def check_chrome_active(self):
-        """Check if Chrome is active and handle enjoy → watching sequence"""
+        """Start a Chrome check on the thread pool so the GUI thread never blocks on it"""
+        if self.chrome_probe_pending:
+            self.chrome_probe_again = True  # on_chrome_result probes once more when this one lands
+            return
+        self.chrome_probe_pending = True
+        QThreadPool.globalInstance().start(ChromeProbe(self))
+
+    @pyqtSlot(bool)
+    def on_chrome_result(self, chrome_active):
+        """Handle the Chrome check result and drive the enjoy → watching sequence"""
+        self.chrome_probe_pending = False
+        if self.chrome_probe_again:
+            # The probe may have read the window before the latest switch; the new one has the final say
+            self.chrome_probe_again = False
+            self.check_chrome_active()
+            return
         try:
-            chrome_active = self.is_chrome_active_window()
-            current_time = time.time()
-
             # Chrome just became active
             if chrome_active and not self.is_chrome_active:
                 print("🌐 Chrome detected!")
                 self.is_chrome_active = True
-                self.chrome_first_detected_time = current_time
+                self.chrome_first_detected_time = self.clock.elapsed()
 
-                # Store current position for Chrome animations
+                # Store current position for Chrome animations; pinned there, so the update loop can stop
                 self.chrome_fixed_position = (self.x(), self.y())
+                self.anim_timer.stop()
 
                 # Start with enjoying animation
                 self.chrome_state = "enjoying"
@@ -519,44 +800,55 @@ class StickmanOverlay(QLabel):
                 self.chrome_state = "none"
                 self.chrome_first_detected_time = None
                 self.chrome_fixed_position = None
+                # Cursor speed from before Chrome came up says nothing about the cursor now
+                self.speed_ema = 0.0
+                self.cursor_fast = False
 
                 # Return to idle if currently in browser-specific animations
-                if self.cur_name in (ENJOY, WATCHING):
+                if self.cur_name in CHROME_ANIMS:
                     self.return_to_idle_1()
 
+                # The update loop was stopped for the Chrome phase
+                if not self.anim_timer.isActive():
+                    self.anim_timer.start(TICK_ACTIVE_MS)
+
         except Exception as e:
             print(f"Chrome check error: {e}")
 
     def update_state(self):
         """Main state update loop"""
         try:
-            if not HAS_PYAUTOGUI:
-                return
+            # Get current cursor position; with no raw mouse input since the last tick it cannot have moved
+            if self.raw_input_active and not self.mouse_dirty and self.last_cursor_x is not None:
+                cursor_x, cursor_y = self.last_cursor_x, self.last_cursor_y
+            else:
+                self.mouse_dirty = False
+                try:
+                    cursor_x, cursor_y = get_cursor_pos()
+                except Exception:
+                    return
 
-            # Get current cursor position
-            try:
-                cursor_pos = pyautogui.position()
-            except Exception:
+            if self.last_cursor_x is None:
+                self.last_cursor_x, self.last_cursor_y = cursor_x, cursor_y
                 return
 
-            if not self.last_cursor_pos:
-                self.last_cursor_pos = cursor_pos
-                return
+            # One clock read per tick serves every timing check below
+            now_ms = self.clock.elapsed()
 
             # Check if cursor moved
-            cursor_moved = (cursor_pos.x != self.last_cursor_pos.x or
-                          cursor_pos.y != self.last_cursor_pos.y)
+            last_x, last_y = self.last_cursor_x, self.last_cursor_y
+            cursor_moved = cursor_x != last_x or cursor_y != last_y
 
             if cursor_moved:
-                self.last_cursor_move_time = time.time()
+                self.last_cursor_move_ms = now_ms
                 if self.cursor_stationary:
                     self.cursor_stationary = False
                     # Reset idle sequence when cursor starts moving
-                    if self.cur_name in IDLE_CLIPS and self.chrome_state == "none":
+                    if self.cur_name in IDLE_CLIPS_SET and self.chrome_state == "none":
                         self.reset_idle_sequence()
             else:
                 # Check if cursor has been stationary
-                if time.time() - self.last_cursor_move_time > 1.0:
+                if now_ms - self.last_cursor_move_ms > 1000:
                     if not self.cursor_stationary:
                         self.cursor_stationary = True
                         # Start idle sequence
@@ -565,32 +857,51 @@ class StickmanOverlay(QLabel):
                             self.start_idle_sequence()
 
             # Handle Chrome mode positioning
-            if self.chrome_state in ["enjoying", "watching"] and self.chrome_fixed_position:
-                # Stay at fixed position during Chrome animations
-                self.move(self.chrome_fixed_position[0], self.chrome_fixed_position[1])
-                self.last_cursor_pos = cursor_pos
+            if self.chrome_state in CHROME_STATES and self.chrome_fixed_position:
+                # Pinned where Chrome was detected, so there is nothing to update until it closes;
+                # on_chrome_result restarts the loop
+                self.last_cursor_x, self.last_cursor_y = cursor_x, cursor_y
+                self.anim_timer.stop()
                 return
 
             # Skip movement logic for special animations or when locked
-            if (self.cur_name in (CLICK_SINGLE, CLICK_DOUBLE, ENJOY, WATCHING)
+            if (self.cur_name in SPECIAL_ANIMS
                 or self.movement_locked):
-                self.last_cursor_pos = cursor_pos
+                self.last_cursor_x, self.last_cursor_y = cursor_x, cursor_y
+                return
+
+            # Idle beside a cursor that has not moved: no step, clip switch or window move can follow
+            if (not cursor_moved and self.cur_name in IDLE_CLIPS_SET
+                    and -20000 <= cursor_x * 1000 - self.stickman_mx <= 20000):
+                self.last_step_ms = now_ms  # The next move is timed from here, not from the last step
+                self.speed_ema = 0.0
+                self.cursor_fast = False
+                # Parked next to a resting cursor: tick slowly until the cursor moves again
+                interval = TICK_IDLE_MS if self.cursor_stationary else TICK_ACTIVE_MS
+                if self.anim_timer.interval() != interval:
+                    self.anim_timer.setInterval(interval)
                 return
 
             # Calculate cursor speed and movement
-            dx = cursor_pos.x - self.last_cursor_pos.x
-            elapsed_ms = max(1, self.vel_timer.restart())
-            cursor_speed = abs(dx) / (elapsed_ms / 1000.0)
+            dx = cursor_x - last_x
+            elapsed_ms = max(1, now_ms - self.last_step_ms)
+            self.last_step_ms = now_ms
+            # Smoothed cursor speed; the 10 ms floor keeps two back-to-back ticks from reading as a spike
+            self.speed_ema = 0.7 * self.speed_ema + 0.3 * abs(dx) * 1000 / max(10, elapsed_ms)
+            is_fast = self.speed_ema >= (FAST_CURSOR_SPEED_LO if self.cursor_fast else FAST_CURSOR_SPEED)
+            self.cursor_fast = is_fast
 
             # Calculate distance between cursor and stickman
-            distance_to_cursor = abs(cursor_pos.x - self.stickman_x)
+            # Positions are kept in thousandths of a pixel so the smoothing stays in integer math
+            # The signed offset gives both distance and heading
+            stickman_mx = self.stickman_mx
+            offset_m = cursor_x * 1000 - stickman_mx
+            distance_m = offset_m if offset_m >= 0 else -offset_m
+            distance_to_cursor = -(-distance_m // 1000)  # Whole pixels, rounded up
 
             # Update stickman position
-            if distance_to_cursor > 20:
-                if cursor_pos.x > self.stickman_x:
-                    new_direction = "right"
-                else:
-                    new_direction = "left"
+            if distance_m > 20000:
+                new_direction = "right" if offset_m > 0 else "left"
 
                 # Check if direction changed
                 if new_direction != self.current_direction and self.cur_name in RUNNING_ANIMS:
@@ -599,30 +910,31 @@ class StickmanOverlay(QLabel):
 
                 self.current_direction = new_direction
 
-                # Move stickman towards cursor with lag
-                move_amount = distance_to_cursor * STICKMAN_FOLLOW_SPEED * (elapsed_ms / 1000.0)
-                if cursor_pos.x > self.stickman_x:
-                    self.stickman_x += move_amount
-                else:
-                    self.stickman_x -= move_amount
-
-                # Don't overshoot
-                if abs(cursor_pos.x - self.stickman_x) < move_amount:
-                    self.stickman_x = cursor_pos.x
+                # Move stickman towards cursor with lag; capped at the distance so it never overshoots
+                move_m = min(distance_m * FOLLOW_SPEED_MILLI * elapsed_ms // 1000000, distance_m)
+                stickman_mx += move_m if offset_m > 0 else -move_m
+                self.stickman_mx = stickman_mx
 
             # Update stickman visual position
-            new_x = max(0, min(int(self.stickman_x) - self.width() // 2,
-                             self._screen_size.width - self.width()))
-            self.move(new_x, self.fixed_y)
+            # Clamped with plain comparisons, upper bound first so a screen narrower than the window pins at 0
+            new_x = stickman_mx // 1000 - HALF_WINDOW_WIDTH
+            if new_x > self.max_x:
+                new_x = self.max_x
+            if new_x < 0:
+                new_x = 0
+            self.move_to(new_x, self.fixed_y)
 
             # Animation logic
-            if cursor_speed >= FAST_CURSOR_SPEED and cursor_moved and distance_to_cursor > 100:
+            if is_fast and cursor_moved and distance_to_cursor > 100:
                 # Fast cursor movement - running
-                run_anim = RUN_RIGHT if self.current_direction == "right" else RUN_LEFT
-                if run_anim in self.movies and not self.movement_locked:
+                facing_right = self.current_direction == "right"
+                run_anim = RUN_RIGHT if facing_right else RUN_LEFT
+                # Already running this way: re-setting would re-arm the run-idle timer every tick
+                if (self.cur_name != run_anim and self.cur_name != (RUN_IDLE_R if facing_right else RUN_IDLE_L)
+                        and run_anim in self.movies and not self.movement_locked):
                     self.set_animation(run_anim)
                     self.movement_locked = False
-                    QTimer.singleShot(800, self.start_running_idle)
+                    self.run_idle_timer.start()  # Re-arms rather than stacking another timer
 
             elif cursor_moved and distance_to_cursor > 20:
                 # Normal cursor movement - walking
@@ -632,17 +944,20 @@ class StickmanOverlay(QLabel):
 
             elif distance_to_cursor <= 30:
                 # Stickman caught up
-                if self.cur_name in [RUN_LEFT, RUN_RIGHT, WALK_LEFT, WALK_RIGHT]:
+                if self.cur_name in GROUND_MOVE:
                     self.return_to_idle()
-                elif self.cur_name in [RUN_IDLE_L, RUN_IDLE_R]:
-                    if (self.running_idle_start_time and
-                        time.time() - self.running_idle_start_time > RUN_IDLE_MAX_TIME):
+                elif self.cur_name in RUN_IDLES:
+                    if (self.running_idle_start_time is not None and
+                        now_ms - self.running_idle_start_time > RUN_IDLE_MAX_TIME * 1000):
                         slow_anim = RUN2SLOW_R if self.current_direction == "right" else RUN2SLOW_L
                         if slow_anim in self.movies:
                             self.movement_locked = True
                             self.set_animation(slow_anim)
 
-            self.last_cursor_pos = cursor_pos
+            if self.anim_timer.interval() != TICK_ACTIVE_MS:
+                self.anim_timer.setInterval(TICK_ACTIVE_MS)
+
+            self.last_cursor_x, self.last_cursor_y = cursor_x, cursor_y
 
         except Exception as e:
             print(f"State update error: {e}")
@@ -650,11 +965,11 @@ class StickmanOverlay(QLabel):
     def start_running_idle(self):
         """Start running idle animation"""
         try:
-            if self.cur_name in [RUN_LEFT, RUN_RIGHT] and not self.movement_locked:
+            if self.cur_name in RUN_ANIMS and not self.movement_locked:
                 idle_anim = RUN_IDLE_R if self.current_direction == "right" else RUN_IDLE_L
                 if idle_anim in self.movies:
                     self.set_animation(idle_anim)
-                    self.running_idle_start_time = time.time()
+                    self.running_idle_start_time = self.clock.elapsed()
         except Exception as e:
             print(f"Running idle error: {e}")
 
@@ -666,26 +981,26 @@ class StickmanOverlay(QLabel):
                 self.anim_timer.stop()
             if hasattr(self, 'browser_timer'):
                 self.browser_timer.stop()
+            if hasattr(self, 'warm_timer'):
+                self.warm_timer.stop()
+            if self.foreground_hook:
+                user32.UnhookWinEvent(self.foreground_hook)
+                self.foreground_hook = None
             if hasattr(self, 'idle_timer'):
                 self.idle_timer.stop()
+            if hasattr(self, 'run_idle_timer'):
+                self.run_idle_timer.stop()
             if hasattr(self, 'enjoy_timer'):
                 self.enjoy_timer.stop()
-            if hasattr(self, 'click_timer'):
-                self.click_timer.stop()
             if hasattr(self, 'click_timer_single'):
                 self.click_timer_single.stop()
             if hasattr(self, 'click_timer_double'):
                 self.click_timer_double.stop()
 
-            # Stop current movie
+            # Only the current movie is ever running; set_animation stops the previous one
             if self.current_movie:
                 self.current_movie.stop()
 
-            # Clean up all movies
-            for movie in self.movies.values():
-                if movie:
-                    movie.stop()
-
         except Exception as e:
             print(f"Cleanup error: {e}")
 